@@ -1,53 +1,73 @@
 """
 DV360 Agent System - Agents Module
+
+Agent classes and their global instances are loaded lazily (PEP 562), so
+importing this package does not construct every agent and LLM client.
 """
+import importlib
+import sys
+import types
+
 from .base import BaseAgent
 
-# Specialist agents (ReAct-based)
-from .budget_risk_agent import BudgetRiskAgent, budget_risk_agent
-from .performance_agent_simple import PerformanceAgentSimple, performance_agent_simple
-from .audience_agent_simple import AudienceAgentSimple, audience_agent_simple
-from .creative_agent_simple import CreativeAgentSimple, creative_agent_simple
-
-# LangGraph agents
-from .delivery_agent_langgraph import DeliveryAgentLangGraph, delivery_agent_langgraph
-
-# RouteFlow components
-from .orchestrator import Orchestrator, orchestrator
-from .routing_agent import RoutingAgent, routing_agent
-from .gate_node import GateNode, gate_node
-from .diagnosis_agent import DiagnosisAgent, diagnosis_agent
-from .early_exit_node import EarlyExitNode, early_exit_node
-from .recommendation_agent import RecommendationAgent, recommendation_agent
-from .validation_agent import ValidationAgent, validation_agent
-
-__all__ = [
-    "BaseAgent",
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
     # Specialist agents (ReAct-based)
-    "BudgetRiskAgent",
-    "budget_risk_agent",
-    "PerformanceAgentSimple",
-    "performance_agent_simple",
-    "AudienceAgentSimple",
-    "audience_agent_simple",
-    "CreativeAgentSimple",
-    "creative_agent_simple",
+    "BudgetRiskAgent": "budget_risk_agent",
+    "budget_risk_agent": "budget_risk_agent",
+    "PerformanceAgentSimple": "performance_agent_simple",
+    "performance_agent_simple": "performance_agent_simple",
+    "AudienceAgentSimple": "audience_agent_simple",
+    "audience_agent_simple": "audience_agent_simple",
+    "CreativeAgentSimple": "creative_agent_simple",
+    "creative_agent_simple": "creative_agent_simple",
     # LangGraph agents
-    "DeliveryAgentLangGraph",
-    "delivery_agent_langgraph",
+    "DeliveryAgentLangGraph": "delivery_agent_langgraph",
+    "delivery_agent_langgraph": "delivery_agent_langgraph",
     # RouteFlow components
-    "Orchestrator",
-    "orchestrator",
-    "RoutingAgent",
-    "routing_agent",
-    "GateNode",
-    "gate_node",
-    "DiagnosisAgent",
-    "diagnosis_agent",
-    "EarlyExitNode",
-    "early_exit_node",
-    "RecommendationAgent",
-    "recommendation_agent",
-    "ValidationAgent",
-    "validation_agent",
-]
+    "Orchestrator": "orchestrator",
+    "orchestrator": "orchestrator",
+    "RoutingAgent": "routing_agent",
+    "routing_agent": "routing_agent",
+    "GateNode": "gate_node",
+    "gate_node": "gate_node",
+    "DiagnosisAgent": "diagnosis_agent",
+    "diagnosis_agent": "diagnosis_agent",
+    "EarlyExitNode": "early_exit_node",
+    "early_exit_node": "early_exit_node",
+    "RecommendationAgent": "recommendation_agent",
+    "recommendation_agent": "recommendation_agent",
+    "ValidationAgent": "validation_agent",
+    "validation_agent": "validation_agent",
+}
+
+
+class _AgentsModule(types.ModuleType):
+    """Package module type that keeps exported instance names bound to instances."""
+
+    def __setattr__(self, name: str, value) -> None:
+        # Importing a submodule binds e.g. `budget_risk_agent` on the package to the
+        # module object, shadowing the agent instance of the same name. Skip that
+        # binding so the name keeps resolving through __getattr__.
+        if name in _LAZY_EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+sys.modules[__name__].__class__ = _AgentsModule
+
+# Derived from the lazy export map so the two cannot drift apart
+__all__ = ["BaseAgent", *_LAZY_EXPORTS]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,12 +5,12 @@ Uses ReAct agent to query Snowflake and analyze audience/line item performance.
 The LLM can construct SQL queries with dates, aggregations, etc. as needed.
 """
 import time
-from langgraph.prebuilt import create_react_agent
+from functools import lru_cache
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 
-from .base import BaseAgent
+from .base import BaseAgent, render_dated_prompt
 from ..tools.agent_tools import get_audience_agent_tools
-from ..tools.decision_logger import decision_logger
 from ..schemas.agent import AgentOutput, AgentDecisionCreate
 from ..core.telemetry import get_logger
 
@@ -18,31 +18,8 @@ from ..core.telemetry import get_logger
 logger = get_logger(__name__)
 
 
-class AudienceAgentSimple(BaseAgent):
-    """
-    Audience Agent - Minimal ReAct version.
-
-    Uses ReAct agent to:
-    1. Query Snowflake for LINE ITEM level performance data
-    2. Analyze audience segment and targeting effectiveness
-    3. Provide line item optimization recommendations
-    """
-
-    def __init__(self):
-        """Initialize Audience Agent."""
-        super().__init__(
-            agent_name="audience_targeting",
-            description="Analyzes DV360 audience and line item performance",
-            tools=[],
-        )
-
-    def get_system_prompt(self) -> str:
-        """Return system prompt."""
-        from datetime import datetime
-        current_date = datetime.now().strftime("%B %Y")
-        current_year = datetime.now().year
-
-        return f"""You are a DV360 Audience Agent specializing in LINE ITEM level performance analysis for the Quiz advertiser.
+# System prompt template; {current_date} and {current_year} are filled per day
+_SYSTEM_PROMPT_TEMPLATE = """You are a DV360 Audience Agent specializing in LINE ITEM level performance analysis for the Quiz advertiser.
 
 IMPORTANT: The current date is {current_date} (year {current_year}). All date references should be interpreted relative to {current_year} unless explicitly stated otherwise.
 
@@ -223,18 +200,35 @@ Always structure your response with:
 
 Be data-driven, precise with DV360 terminology, and provide clear actionable insights."""
 
+
+class AudienceAgentSimple(BaseAgent):
+    """
+    Audience Agent - Minimal ReAct version.
+
+    Uses ReAct agent to:
+    1. Query Snowflake for LINE ITEM level performance data
+    2. Analyze audience segment and targeting effectiveness
+    3. Provide line item optimization recommendations
+    """
+
+    def __init__(self):
+        """Initialize Audience Agent."""
+        super().__init__(
+            agent_name="audience_targeting",
+            description="Analyzes DV360 audience and line item performance",
+            tools=[],
+        )
+
+    def get_system_prompt(self) -> str:
+        """Return system prompt (rendered once per calendar day)."""
+        return render_dated_prompt(_SYSTEM_PROMPT_TEMPLATE)
+
     async def process(self, input_data) -> AgentOutput:
         """Process input using ReAct agent."""
         start_time = time.time()
 
-        # Get tools (includes execute_custom_snowflake_query)
-        tools = get_audience_agent_tools()
-
-        # Create ReAct agent
-        react_agent = create_react_agent(
-            model=self.llm,
-            tools=tools
-        )
+        # Compiled ReAct agent (built once per tool set, reused across requests)
+        react_agent = self._get_react_agent(get_audience_agent_tools())
 
         # Build messages with conversation history if available
         messages = [SystemMessage(content=self.get_system_prompt())]
@@ -256,7 +250,6 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
 
         # Run agent with system prompt and conversation history
         # Set recursion_limit in config to prevent infinite retry loops
-        from langchain_core.runnables import RunnableConfig
         config = RunnableConfig(recursion_limit=15)  # Limit retries to prevent infinite loops
         
         result = await react_agent.ainvoke({"messages": messages}, config=config)
@@ -267,7 +260,7 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
         # Log decision
         execution_time_ms = int((time.time() - start_time) * 1000)
         if input_data.session_id:
-            await decision_logger.log_decision(AgentDecisionCreate(
+            await self._log_decision(AgentDecisionCreate(
                 session_id=input_data.session_id,
                 agent_name=self.agent_name,
                 decision_type="audience_analysis",
@@ -286,15 +279,15 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
             confidence=0.9
         )
 
-    def _extract_response(self, messages) -> str:
-        """Extract final response from ReAct agent messages."""
-        # Get the last AI message (the final response)
-        for msg in reversed(messages):
-            if hasattr(msg, 'content') and msg.content and hasattr(msg, 'type'):
-                if msg.type == 'ai':
-                    return msg.content
-        return "Analysis complete"
+
+@lru_cache(maxsize=None)
+def get_audience_agent_simple() -> AudienceAgentSimple:
+    """Return the shared AudienceAgentSimple, constructing it on first use."""
+    return AudienceAgentSimple()
 
 
-# Global instance
-audience_agent_simple = AudienceAgentSimple()
+def __getattr__(name: str):
+    # Global instance, created lazily on first access (PEP 562)
+    if name == "audience_agent_simple":
+        return get_audience_agent_simple()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
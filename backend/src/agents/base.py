@@ -2,8 +2,10 @@
 Base agent class for all DV360 agents.
 """
 import os
-from typing import Dict, List, Any, Optional, Literal, Union
-from abc import ABC, abstractmethod
+import asyncio
+from typing import Awaitable, Callable, ClassVar, Dict, List, Any, Optional, Literal, Set, Union
+from datetime import date
+from functools import lru_cache
 import time
 from uuid import UUID
 
@@ -17,21 +19,98 @@ if not os.getenv("LANGCHAIN_TRACING_V2") and os.getenv("LANGCHAIN_API_KEY"):
 
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langchain_core.language_models import BaseChatModel
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+from langgraph.prebuilt import create_react_agent
 
 from ..core.config import settings
 from ..core.telemetry import get_logger, log_agent_execution
-from ..schemas.agent import AgentInput, AgentOutput, AgentState
+from ..schemas.agent import AgentInput, AgentOutput, AgentState, AgentDecisionCreate
+from ..tools.decision_logger import decision_logger
 
 
 logger = get_logger(__name__)
 
+# Returned by _extract_response when a ReAct run produced no AI text
+FALLBACK_RESPONSE = "Analysis complete"
 
-class BaseAgent(ABC):
+
+@lru_cache(maxsize=32)
+def _render_prompt_for_day(template: str, day_ordinal: int) -> str:
+    """Render a dated prompt template for a given day (memoized)."""
+    day = date.fromordinal(day_ordinal)
+    return template.format(current_date=day.strftime("%B %Y"), current_year=day.year)
+
+
+@lru_cache(maxsize=8)
+def get_shared_llm(
+    provider: Literal["anthropic", "openai"],
+    model: str,
+    api_key: str,
+    temperature: float = 0.1,
+) -> BaseChatModel:
+    """
+    Return a process-wide chat model client for (provider, model, temperature).
+
+    Each client owns an HTTP connection pool, so sharing one per configuration
+    gives better keep-alive reuse than a client per agent. Provider packages are
+    imported lazily so only the chosen provider's client library is loaded.
+
+    Args:
+        provider: "anthropic" or "openai"
+        model: Model name
+        api_key: Provider API key
+        temperature: Sampling temperature
+
+    Returns:
+        Shared chat model instance
+    """
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+        return ChatAnthropic(model=model, temperature=temperature, api_key=api_key)
+    if provider == "openai":
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(model=model, temperature=temperature, api_key=api_key)
+    raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def render_dated_prompt(template: str) -> str:
+    """
+    Fill {current_date} and {current_year} in a system prompt template.
+
+    The rendered prompt is cached per (template, calendar day), so agents do not
+    rebuild their multi-KB prompt on every request.
+
+    Args:
+        template: Prompt template using str.format placeholders
+
+    Returns:
+        Prompt with today's month/year filled in
+    """
+    return _render_prompt_for_day(template, date.today().toordinal())
+
+
+async def warm_llm(llm: BaseChatModel) -> None:
+    """
+    Open an LLM client's provider connection ahead of the first real request.
+
+    Sends a one-token completion so the HTTP connection pool, TLS session and
+    auth are established. Failures are logged and ignored.
+
+    Args:
+        llm: Chat model to warm up
+    """
+    try:
+        await llm.bind(max_tokens=1).ainvoke("ping")
+    except Exception as e:
+        logger.warning("LLM warmup failed", llm_type=type(llm).__name__, error_message=str(e))
+
+
+class BaseAgent:
     """
     Base class for all DV360 agents.
 
+    Subclasses must implement get_system_prompt() and process(). This is a plain
+    class rather than an ABC to avoid ABCMeta checks on every instantiation.
+
     Provides common functionality:
     - LLM initialization
     - Tool management
@@ -40,6 +119,15 @@ class BaseAgent(ABC):
     - LangGraph state management
     """
 
+    # Max in-flight background decision writes before callers wait inline
+    MAX_BACKGROUND_TASKS: ClassVar[int] = 100
+
+    # Background tasks shared by all agents so shutdown can drain them in one place
+    _bg_tasks: ClassVar[Set[asyncio.Task]] = set()
+
+    # Process-wide cap on concurrent invoke_many agent runs (created on first use)
+    _invoke_semaphore: ClassVar[Optional[asyncio.Semaphore]] = None
+
     def __init__(
         self,
         agent_name: str,
@@ -73,6 +161,7 @@ class BaseAgent(ABC):
             self.llm = self._initialize_llm()
         
         self.graph = None
+        self._react_agents: Dict[tuple, Any] = {}
 
         logger.info(f"Initialized agent: {agent_name}", tools_count=len(self.tools))
 
@@ -92,6 +181,9 @@ class BaseAgent(ABC):
         - LANGCHAIN_PROJECT is set
 
         No manual tracer setup needed - LangChain handles it automatically.
+
+        Clients come from get_shared_llm, so agents using the same provider and
+        model share one client (and its HTTP connection pool).
         """
         # Log tracing status
         if os.getenv("LANGCHAIN_TRACING_V2") == "true":
@@ -106,40 +198,23 @@ class BaseAgent(ABC):
             if not settings.anthropic_api_key:
                 raise ValueError("Anthropic API key not configured. Set ANTHROPIC_API_KEY")
             logger.info("Using Anthropic Claude for LLM", model=settings.anthropic_model)
-            return ChatAnthropic(
-                model=settings.anthropic_model,
-                temperature=0.1,
-                api_key=settings.anthropic_api_key,
-            )
+            return get_shared_llm("anthropic", settings.anthropic_model, settings.anthropic_api_key)
         elif provider == "openai":
             if not settings.openai_api_key:
                 raise ValueError("OpenAI API key not configured. Set OPENAI_API_KEY")
             logger.info("Using OpenAI GPT for LLM", model=settings.openai_model)
-            return ChatOpenAI(
-                model=settings.openai_model,
-                temperature=0.1,
-                api_key=settings.openai_api_key,
-            )
-        
+            return get_shared_llm("openai", settings.openai_model, settings.openai_api_key)
+
         # Default: try Anthropic first, then OpenAI
         if settings.anthropic_api_key:
             logger.info("Using Anthropic Claude for LLM", model=settings.anthropic_model)
-            return ChatAnthropic(
-                model=settings.anthropic_model,
-                temperature=0.1,
-                api_key=settings.anthropic_api_key,
-            )
+            return get_shared_llm("anthropic", settings.anthropic_model, settings.anthropic_api_key)
         elif settings.openai_api_key:
             logger.info("Using OpenAI GPT for LLM", model=settings.openai_model)
-            return ChatOpenAI(
-                model=settings.openai_model,
-                temperature=0.1,
-                api_key=settings.openai_api_key,
-            )
+            return get_shared_llm("openai", settings.openai_model, settings.openai_api_key)
         else:
             raise ValueError("No LLM API key configured. Set ANTHROPIC_API_KEY or OPENAI_API_KEY")
 
-    @abstractmethod
     def get_system_prompt(self) -> str:
         """
         Return the system prompt for this agent.
@@ -149,9 +224,8 @@ class BaseAgent(ABC):
         - Available tools and when to use them
         - Output format expectations
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement get_system_prompt()")
 
-    @abstractmethod
     async def process(self, input_data: AgentInput) -> AgentOutput:
         """
         Process an input and return agent output.
@@ -162,7 +236,7 @@ class BaseAgent(ABC):
         Returns:
             AgentOutput with response and metadata
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement process()")
 
 
     async def invoke(self, input_data: AgentInput) -> AgentOutput:
@@ -198,3 +272,205 @@ class BaseAgent(ABC):
             )
 
             raise
+
+    async def warmup(self, connect: bool = True) -> None:
+        """
+        Render the system prompt into its cache and open the LLM connection.
+
+        Args:
+            connect: Also ping the LLM client; pass False when another agent
+                sharing the same client already does
+        """
+        try:
+            self.get_system_prompt()
+        except Exception as e:
+            logger.warning("Prompt warmup failed", agent_name=self.agent_name, error_message=str(e))
+        if connect:
+            await warm_llm(self.llm)
+
+    def _build_system_message(self, static_prompt: str, dynamic_suffix: str = "") -> SystemMessage:
+        """
+        Build a system message laid out for provider-side prompt caching.
+
+        The static block goes first. For Anthropic it is sent as its own content
+        block marked cache_control=ephemeral, so repeat calls within the cache TTL
+        reuse it. OpenAI caches long identical prefixes automatically, so there the
+        parts are simply concatenated, static first.
+
+        Args:
+            static_prompt: Prompt text that is identical across requests
+            dynamic_suffix: Small per-request/per-day text appended after it
+
+        Returns:
+            SystemMessage for the LLM
+        """
+        if getattr(self.llm, "_llm_type", "") == "anthropic-chat":
+            content = [{"type": "text", "text": static_prompt, "cache_control": {"type": "ephemeral"}}]
+            if dynamic_suffix:
+                content.append({"type": "text", "text": dynamic_suffix})
+            return SystemMessage(content=content)
+
+        if dynamic_suffix:
+            return SystemMessage(content=f"{static_prompt}\n\n{dynamic_suffix}")
+        return SystemMessage(content=static_prompt)
+
+    @staticmethod
+    def _extract_response(messages: List[BaseMessage]) -> str:
+        """
+        Extract the final answer from a ReAct agent's messages.
+
+        The final AI message is normally last, so the reverse scan usually stops
+        at the first element.
+
+        Args:
+            messages: Messages from the ReAct agent result
+
+        Returns:
+            Content of the last non-empty AI message
+        """
+        for msg in reversed(messages):
+            if isinstance(msg, AIMessage) and msg.content:
+                return msg.content
+        return FALLBACK_RESPONSE
+
+    def _build_query_message(self, query: str) -> HumanMessage:
+        """
+        Build the current-query message, marked as a prompt cache breakpoint.
+
+        A ReAct run makes one LLM call per tool step, each resending the system
+        prompt, history and query. For Anthropic the query is sent as a content
+        block with cache_control=ephemeral, so calls 2..N read that whole prefix
+        from cache instead of only the system block. Other providers get plain text.
+
+        Args:
+            query: Current user query
+
+        Returns:
+            HumanMessage for the LLM
+        """
+        if getattr(self.llm, "_llm_type", "") == "anthropic-chat":
+            return HumanMessage(content=[{"type": "text", "text": query, "cache_control": {"type": "ephemeral"}}])
+        return HumanMessage(content=query)
+
+    def _get_react_agent(self, tools: List[Any]):
+        """
+        Return a compiled ReAct agent over this agent's LLM and the given tools.
+
+        Compiling the graph and binding tool schemas is repeated work, so the
+        agent is built once per tool set (keyed by tool names) and reused.
+
+        Args:
+            tools: LangChain tools the agent may call
+
+        Returns:
+            Compiled ReAct agent graph
+        """
+        key = tuple(tool.name for tool in tools)
+        react_agent = self._react_agents.get(key)
+        if react_agent is None:
+            react_agent = self._react_agents[key] = create_react_agent(model=self.llm, tools=tools)
+        return react_agent
+
+    @staticmethod
+    async def invoke_many(
+        agents: List["BaseAgent"],
+        input_data: AgentInput,
+        on_complete: Optional[Callable[[int, Union[AgentOutput, Exception]], Awaitable[None]]] = None,
+    ) -> List[Union[AgentOutput, BaseException]]:
+        """
+        Invoke several agents concurrently with the same input.
+
+        Concurrency is capped process-wide at settings.max_concurrent_agent_invocations
+        to protect provider rate limits. Runs them one after another instead when
+        settings.enable_parallel_agent_execution is off (e.g. to debug); results
+        have the same shape either way.
+
+        Args:
+            agents: Agents to invoke
+            input_data: Input passed to every agent
+            on_complete: Optional async callback awaited with (index, output or
+                exception) as each agent finishes, in completion order; its
+                failures are logged and do not affect the results
+
+        Returns:
+            One entry per agent, in order: its AgentOutput, or the exception it raised
+        """
+        async def invoke(agent: "BaseAgent") -> Union[AgentOutput, Exception]:
+            try:
+                return await agent.invoke(input_data)
+            except Exception as e:
+                return e
+
+        async def notify(index: int, output: Union[AgentOutput, Exception]) -> None:
+            # A failing callback must not replace the agent's result
+            if on_complete is None:
+                return
+            try:
+                await on_complete(index, output)
+            except Exception as e:
+                logger.warning(
+                    "Agent completion callback failed",
+                    agent_name=agents[index].agent_name,
+                    error_message=str(e)
+                )
+
+        async def run(index: int, agent: "BaseAgent") -> Union[AgentOutput, Exception]:
+            output = await invoke(agent)
+            await notify(index, output)
+            return output
+
+        if settings.enable_parallel_agent_execution or len(agents) < 2:
+            if BaseAgent._invoke_semaphore is None:
+                BaseAgent._invoke_semaphore = asyncio.Semaphore(settings.max_concurrent_agent_invocations)
+            semaphore = BaseAgent._invoke_semaphore
+
+            async def bounded_run(index: int, agent: "BaseAgent") -> Union[AgentOutput, Exception]:
+                # The callback runs after the slot is released so it cannot hold the cap
+                async with semaphore:
+                    output = await invoke(agent)
+                await notify(index, output)
+                return output
+
+            return await asyncio.gather(
+                *(bounded_run(index, agent) for index, agent in enumerate(agents)),
+                return_exceptions=True,
+            )
+
+        return [await run(index, agent) for index, agent in enumerate(agents)]
+
+    async def _log_decision(self, decision: AgentDecisionCreate) -> None:
+        """
+        Log an agent decision without holding up the response.
+
+        The database write runs as a background task. If too many writes are
+        already in flight, it is awaited inline instead to apply backpressure.
+
+        Args:
+            decision: Decision data to log
+        """
+        if len(BaseAgent._bg_tasks) >= self.MAX_BACKGROUND_TASKS:
+            await decision_logger.log_decision(decision)
+            return
+
+        task = asyncio.create_task(decision_logger.log_decision(decision))
+        BaseAgent._bg_tasks.add(task)
+        task.add_done_callback(BaseAgent._on_background_task_done)
+
+    @staticmethod
+    def _on_background_task_done(task: asyncio.Task) -> None:
+        """Drop a finished background task and surface its failure, if any."""
+        BaseAgent._bg_tasks.discard(task)
+        if task.cancelled():
+            return
+
+        # Retrieving the exception also stops asyncio warning that it was never retrieved
+        error = task.exception()
+        if error is not None:
+            logger.error("Background decision log failed", error_message=str(error))
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Wait for outstanding background decision writes to finish."""
+        if BaseAgent._bg_tasks:
+            logger.info("Draining background agent tasks", pending=len(BaseAgent._bg_tasks))
+            await asyncio.gather(*BaseAgent._bg_tasks, return_exceptions=True)
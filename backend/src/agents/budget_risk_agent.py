@@ -5,12 +5,13 @@ Uses ReAct agent to query Snowflake and analyze budget data.
 The LLM can construct SQL queries with dates, aggregations, etc. as needed.
 """
 import time
-from langgraph.prebuilt import create_react_agent
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from functools import lru_cache
+from typing import List
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 
-from .base import BaseAgent
+from .base import BaseAgent, render_dated_prompt
 from ..tools.agent_tools import get_budget_agent_tools
-from ..tools.decision_logger import decision_logger
 from ..schemas.agent import AgentOutput, AgentDecisionCreate
 from ..core.telemetry import get_logger
 
@@ -18,33 +19,9 @@ from ..core.telemetry import get_logger
 logger = get_logger(__name__)
 
 
-class BudgetRiskAgent(BaseAgent):
-    """
-    Budget Risk Agent - Minimal ReAct version.
-    
-    Uses ReAct agent to:
-    1. Query Snowflake (can build custom SQL with dates/aggregations)
-    2. Analyze budget data
-    3. Provide recommendations
-    """
-
-    def __init__(self):
-        """Initialize Budget Risk Agent."""
-        super().__init__(
-            agent_name="budget_risk",
-            description="Analyzes DV360 budget pacing and risk",
-            tools=[],
-        )
-
-    def get_system_prompt(self) -> str:
-        """Return system prompt."""
-        from datetime import datetime
-        current_date = datetime.now().strftime("%B %Y")
-        current_year = datetime.now().year
-
-        return f"""You are a DV360 Budget Risk Agent specializing in budget analysis for the Quiz advertiser.
-
-IMPORTANT: The current date is {current_date} (year {current_year}). All date references should be interpreted relative to {current_year} unless explicitly stated otherwise.
+# Static part of the system prompt. Kept byte-identical across requests and sent
+# first so provider-side prompt caching can reuse it; only the date suffix varies.
+_STATIC_SYSTEM_PROMPT = """You are a DV360 Budget Risk Agent specializing in budget analysis for the Quiz advertiser.
 
 CURRENCY: All budget amounts, spend, and financial values are in BRITISH POUNDS (GBP/£). Always display amounts with £ symbol or specify "GBP" when presenting financial data.
 
@@ -146,21 +123,70 @@ EXAMPLE QUERY PATTERNS:
 
 Be data-driven, precise with DV360 terminology, and provide clear actionable insights."""
 
+# Dynamic suffix, rendered once per day
+_DATE_CONTEXT_TEMPLATE = (
+    "IMPORTANT: The current date is {current_date} (year {current_year}). "
+    "All date references should be interpreted relative to {current_year} unless explicitly stated otherwise."
+)
+
+# Full prompt template for get_system_prompt(); the static block contains no braces
+_SYSTEM_PROMPT_TEMPLATE = f"{_STATIC_SYSTEM_PROMPT}\n\n{_DATE_CONTEXT_TEMPLATE}"
+
+
+class BudgetRiskAgent(BaseAgent):
+    """
+    Budget Risk Agent - Minimal ReAct version.
+    
+    Uses ReAct agent to:
+    1. Query Snowflake (can build custom SQL with dates/aggregations)
+    2. Analyze budget data
+    3. Provide recommendations
+    """
+
+    def __init__(self):
+        """Initialize Budget Risk Agent."""
+        super().__init__(
+            agent_name="budget_risk",
+            description="Analyzes DV360 budget pacing and risk",
+            tools=[],
+        )
+
+    def get_system_prompt(self) -> str:
+        """Return system prompt (static block first, dated suffix last; rendered once per day)."""
+        return render_dated_prompt(_SYSTEM_PROMPT_TEMPLATE)
+
     async def process(self, input_data) -> AgentOutput:
         """Process input using ReAct agent."""
         start_time = time.time()
         
-        # Get tools (includes execute_custom_snowflake_query)
-        tools = get_budget_agent_tools()
+        # Compiled ReAct agent (built once per tool set, reused across requests)
+        react_agent = self._get_react_agent(get_budget_agent_tools())
         
-        # Create ReAct agent
-        react_agent = create_react_agent(
-            model=self.llm,
-            tools=tools
-        )
+        # Run agent with system prompt and conversation history
+        # Set recursion_limit in config to prevent infinite retry loops
+        config = RunnableConfig(recursion_limit=15)  # Limit retries to prevent infinite loops
+        
+        result = await react_agent.ainvoke({"messages": self._build_messages(input_data)}, config=config)
+        
+        # Extract response from messages
+        response_text = self._extract_response(result.get("messages", []))
         
-        # Build messages with conversation history if available
-        messages = [SystemMessage(content=self.get_system_prompt())]
+        # Log decision
+        await self._log_budget_decision(input_data, response_text, start_time)
+        
+        return AgentOutput(
+            response=response_text,
+            agent_name=self.agent_name,
+            reasoning="Budget analysis",
+            tools_used=["snowflake_query", "llm_analysis"],
+            confidence=0.9
+        )
+
+    def _build_messages(self, input_data) -> List[BaseMessage]:
+        """Build system prompt, recent conversation history and the current query."""
+        messages = [
+            self._build_system_message(_STATIC_SYSTEM_PROMPT, render_dated_prompt(_DATE_CONTEXT_TEMPLATE))
+        ]
         
         # Add conversation history for context
         conversation_history = input_data.context.get("conversation_history", []) if input_data.context else []
@@ -174,23 +200,15 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
                 elif role == "assistant":
                     messages.append(AIMessage(content=f"[Previous Response] {content}"))
         
-        # Add current query
-        messages.append(HumanMessage(content=input_data.message))
+        # Add current query (cache breakpoint: ReAct steps 2..N reuse the whole prefix)
+        messages.append(self._build_query_message(input_data.message))
+        return messages
 
-        # Run agent with system prompt and conversation history
-        # Set recursion_limit in config to prevent infinite retry loops
-        from langchain_core.runnables import RunnableConfig
-        config = RunnableConfig(recursion_limit=15)  # Limit retries to prevent infinite loops
-        
-        result = await react_agent.ainvoke({"messages": messages}, config=config)
-        
-        # Extract response from messages
-        response_text = self._extract_response(result.get("messages", []))
-        
-        # Log decision
+    async def _log_budget_decision(self, input_data, response_text: str, start_time: float) -> None:
+        """Log the budget analysis decision for the session, if any."""
         execution_time_ms = int((time.time() - start_time) * 1000)
         if input_data.session_id:
-            await decision_logger.log_decision(AgentDecisionCreate(
+            await self._log_decision(AgentDecisionCreate(
                 session_id=input_data.session_id,
                 agent_name=self.agent_name,
                 decision_type="budget_analysis",
@@ -200,24 +218,16 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
                 reasoning="Budget analysis completed",
                 execution_time_ms=execution_time_ms
             ))
-        
-        return AgentOutput(
-            response=response_text,
-            agent_name=self.agent_name,
-            reasoning="Budget analysis",
-            tools_used=["snowflake_query", "llm_analysis"],
-            confidence=0.9
-        )
 
-    def _extract_response(self, messages) -> str:
-        """Extract final response from ReAct agent messages."""
-        # Get the last AI message (the final response)
-        for msg in reversed(messages):
-            if hasattr(msg, 'content') and msg.content and hasattr(msg, 'type'):
-                if msg.type == 'ai':
-                    return msg.content
-        return "Analysis complete"
+
+@lru_cache(maxsize=None)
+def get_budget_risk_agent() -> BudgetRiskAgent:
+    """Return the shared BudgetRiskAgent, constructing it on first use."""
+    return BudgetRiskAgent()
 
 
-# Global instance
-budget_risk_agent = BudgetRiskAgent()
+def __getattr__(name: str):
+    # Global instance, created lazily on first access (PEP 562)
+    if name == "budget_risk_agent":
+        return get_budget_risk_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
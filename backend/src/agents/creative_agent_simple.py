@@ -5,44 +5,32 @@ Uses ReAct agent to query Snowflake and analyze creative performance.
 The LLM can construct SQL queries with dates, aggregations, etc. as needed.
 """
 import time
-from langgraph.prebuilt import create_react_agent
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from cachetools import TTLCache
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 
-from .base import BaseAgent
+from .base import FALLBACK_RESPONSE, BaseAgent, render_dated_prompt
 from ..tools.agent_tools import get_creative_agent_tools
-from ..tools.decision_logger import decision_logger
 from ..schemas.agent import AgentOutput, AgentDecisionCreate
+from ..core.config import settings
 from ..core.telemetry import get_logger
 
 
 logger = get_logger(__name__)
 
+# Final responses for repeated standalone queries, keyed by (system prompt, normalized query)
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=settings.llm_response_cache_ttl_seconds)
 
-class CreativeAgentSimple(BaseAgent):
-    """
-    Creative Agent - Minimal ReAct version.
 
-    Uses ReAct agent to:
-    1. Query Snowflake for creative-level performance data
-    2. Analyze creative effectiveness by name and size
-    3. Identify creative fatigue and optimization opportunities
-    """
+def _normalize_query(query: str) -> str:
+    """Normalize case, whitespace and trailing punctuation so near-identical queries share a key."""
+    return " ".join(query.lower().split()).rstrip("?!. ")
 
-    def __init__(self):
-        """Initialize Creative Agent."""
-        super().__init__(
-            agent_name="creative_inventory",
-            description="Analyzes DV360 creative performance by name and size",
-            tools=[],
-        )
 
-    def get_system_prompt(self) -> str:
-        """Return system prompt."""
-        from datetime import datetime
-        current_date = datetime.now().strftime("%B %Y")
-        current_year = datetime.now().year
-
-        return f"""You are a DV360 Creative Agent specializing in creative asset performance analysis for the Quiz advertiser.
+# System prompt template; {current_date} and {current_year} are filled per day
+_SYSTEM_PROMPT_TEMPLATE = """You are a DV360 Creative Agent specializing in creative asset performance analysis for the Quiz advertiser.
 
 IMPORTANT: The current date is {current_date} (year {current_year}). All date references should be interpreted relative to {current_year} unless explicitly stated otherwise.
 
@@ -249,24 +237,105 @@ Always structure your response with:
 
 Be data-driven, precise with DV360 terminology, and provide clear actionable insights."""
 
+
+class CreativeAgentSimple(BaseAgent):
+    """
+    Creative Agent - Minimal ReAct version.
+
+    Uses ReAct agent to:
+    1. Query Snowflake for creative-level performance data
+    2. Analyze creative effectiveness by name and size
+    3. Identify creative fatigue and optimization opportunities
+    """
+
+    def __init__(self):
+        """Initialize Creative Agent."""
+        super().__init__(
+            agent_name="creative_inventory",
+            description="Analyzes DV360 creative performance by name and size",
+            tools=[],
+        )
+
+    def get_system_prompt(self) -> str:
+        """Return system prompt (rendered once per calendar day)."""
+        return render_dated_prompt(_SYSTEM_PROMPT_TEMPLATE)
+
     async def process(self, input_data) -> AgentOutput:
         """Process input using ReAct agent."""
         start_time = time.time()
 
-        # Get tools (includes execute_custom_snowflake_query)
-        tools = get_creative_agent_tools()
+        system_prompt = self.get_system_prompt()
+        conversation_history = input_data.context.get("conversation_history", []) if input_data.context else []
+        cache_key = self._response_cache_key(system_prompt, conversation_history, input_data.message)
+
+        response_text = _RESPONSE_CACHE.get(cache_key) if cache_key is not None else None
+        if response_text is not None:
+            logger.info("Creative response cache hit", length=len(response_text))
+        else:
+            response_text = await self._run_react_agent(system_prompt, conversation_history, input_data.message)
+            # Don't serve a fallback or empty answer for the whole TTL
+            if cache_key is not None and response_text and response_text != FALLBACK_RESPONSE:
+                _RESPONSE_CACHE[cache_key] = response_text
+
+        # Log decision
+        await self._log_creative_decision(input_data, response_text, start_time)
 
-        # Create ReAct agent
-        react_agent = create_react_agent(
-            model=self.llm,
-            tools=tools
+        return AgentOutput(
+            response=response_text,
+            agent_name=self.agent_name,
+            reasoning="Creative analysis",
+            tools_used=["snowflake_query", "llm_analysis"],
+            confidence=0.9
         )
 
-        # Build messages with conversation history if available
-        messages = [SystemMessage(content=self.get_system_prompt())]
+    @staticmethod
+    def _response_cache_key(
+        system_prompt: str,
+        conversation_history: List[Dict[str, Any]],
+        message: str
+    ) -> Optional[tuple]:
+        """
+        Return the response cache key, or None when the cache must be bypassed.
+
+        Standalone queries (no history to resolve against) are served from the
+        response cache when the same question was answered within the TTL. The
+        key doesn't cover the Snowflake data the answer was built from, so the
+        cache is opt-in via settings.enable_creative_response_cache.
+        """
+        if settings.enable_creative_response_cache and not conversation_history:
+            return (system_prompt, _normalize_query(message))
+        return None
+
+    async def _run_react_agent(
+        self,
+        system_prompt: str,
+        conversation_history: List[Dict[str, Any]],
+        message: str
+    ) -> str:
+        """Run the ReAct agent over the query and return its final answer."""
+        # Compiled ReAct agent (built once per tool set, reused across requests)
+        react_agent = self._get_react_agent(get_creative_agent_tools())
+
+        # Run agent with system prompt and conversation history
+        # Set recursion_limit in config to prevent infinite retry loops
+        config = RunnableConfig(recursion_limit=15)  # Limit retries to prevent infinite loops
+        
+        messages = self._build_messages(system_prompt, conversation_history, message)
+        result = await react_agent.ainvoke({"messages": messages}, config=config)
+
+        # Extract response from messages
+        return self._extract_response(result.get("messages", []))
+
+    def _build_messages(
+        self,
+        system_prompt: str,
+        conversation_history: List[Dict[str, Any]],
+        message: str
+    ) -> List[BaseMessage]:
+        """Build system prompt, recent conversation history and the current query."""
+        messages = [SystemMessage(content=system_prompt)]
         
         # Add conversation history for context
-        conversation_history = input_data.context.get("conversation_history", []) if input_data.context else []
         if conversation_history:
             # Add previous messages for context (last 10 messages to avoid token limits)
             for msg in conversation_history[-10:]:
@@ -278,22 +347,14 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
                     messages.append(AIMessage(content=f"[Previous Response] {content}"))
         
         # Add current query
-        messages.append(HumanMessage(content=input_data.message))
-
-        # Run agent with system prompt and conversation history
-        # Set recursion_limit in config to prevent infinite retry loops
-        from langchain_core.runnables import RunnableConfig
-        config = RunnableConfig(recursion_limit=15)  # Limit retries to prevent infinite loops
-        
-        result = await react_agent.ainvoke({"messages": messages}, config=config)
-
-        # Extract response from messages
-        response_text = self._extract_response(result.get("messages", []))
+        messages.append(HumanMessage(content=message))
+        return messages
 
-        # Log decision
+    async def _log_creative_decision(self, input_data, response_text: str, start_time: float) -> None:
+        """Log the creative analysis decision for the session, if any."""
         execution_time_ms = int((time.time() - start_time) * 1000)
         if input_data.session_id:
-            await decision_logger.log_decision(AgentDecisionCreate(
+            await self._log_decision(AgentDecisionCreate(
                 session_id=input_data.session_id,
                 agent_name=self.agent_name,
                 decision_type="creative_analysis",
@@ -304,23 +365,15 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
                 execution_time_ms=execution_time_ms
             ))
 
-        return AgentOutput(
-            response=response_text,
-            agent_name=self.agent_name,
-            reasoning="Creative analysis",
-            tools_used=["snowflake_query", "llm_analysis"],
-            confidence=0.9
-        )
 
-    def _extract_response(self, messages) -> str:
-        """Extract final response from ReAct agent messages."""
-        # Get the last AI message (the final response)
-        for msg in reversed(messages):
-            if hasattr(msg, 'content') and msg.content and hasattr(msg, 'type'):
-                if msg.type == 'ai':
-                    return msg.content
-        return "Analysis complete"
+@lru_cache(maxsize=None)
+def get_creative_agent_simple() -> CreativeAgentSimple:
+    """Return the shared CreativeAgentSimple, constructing it on first use."""
+    return CreativeAgentSimple()
 
 
-# Global instance
-creative_agent_simple = CreativeAgentSimple()
+def __getattr__(name: str):
+    # Global instance, created lazily on first access (PEP 562)
+    if name == "creative_agent_simple":
+        return get_creative_agent_simple()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
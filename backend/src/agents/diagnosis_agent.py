@@ -4,10 +4,11 @@ Diagnosis Agent - Analyzes results from multiple agents to find root causes.
 This agent takes outputs from specialist agents and identifies patterns,
 correlations, and root causes across different perspectives.
 """
+import json
 from typing import Dict, Any, List, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_anthropic import ChatAnthropic
 
+from .base import get_shared_llm
 from ..core.config import settings
 from ..core.telemetry import get_logger
 
@@ -25,9 +26,10 @@ class DiagnosisAgent:
 
     def __init__(self):
         """Initialize Diagnosis Agent."""
-        self.llm = ChatAnthropic(
-            model=settings.anthropic_model,
-            api_key=settings.anthropic_api_key,
+        self.llm = get_shared_llm(
+            "anthropic",
+            settings.anthropic_model,
+            settings.anthropic_api_key,
             temperature=0.3,
         )
 
@@ -55,7 +57,6 @@ class DiagnosisAgent:
             - correlations: List[str] - Cross-agent correlations
             - summary: str - Diagnosis summary
         """
-        import json
 
         # Extract key information from each agent
         agent_summaries = {}
@@ -135,7 +136,7 @@ Your diagnosis:"""
                 HumanMessage(content=diagnosis_prompt)
             ]
 
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             response_text = response.content.strip()
 
             logger.info("Diagnosis LLM response", response_preview=response_text[:200])
@@ -4,12 +4,23 @@ Early Exit Node - Determines if further processing is needed.
 This node checks if the query can be answered without generating
 recommendations (e.g., all metrics are good, no issues found).
 """
+import re
+from functools import lru_cache
 from typing import Dict, Any
 from ..core.telemetry import get_logger
 
 
 logger = get_logger(__name__)
 
+# Informational phrasings, matched anywhere in the query in a single scan
+_INFO_RE = re.compile(r"how is|what is|show me|tell me about|explain", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _agent_display_name(agent_name: str) -> str:
+    """Human-readable agent name (e.g. "budget_risk" -> "Budget Risk")."""
+    return agent_name.replace("_", " ").title()
+
 
 class EarlyExitNode:
     """
@@ -86,9 +97,7 @@ class EarlyExitNode:
         # For now, use a simple heuristic
 
         # Check if query is purely informational (not asking for recommendations)
-        informational_keywords = ["how is", "what is", "show me", "tell me about", "explain"]
-        query_lower = query.lower()
-        if any(keyword in query_lower for keyword in informational_keywords):
+        if _INFO_RE.search(query):
             if len(issues) <= 2:
                 # Informational query with few issues - can exit early
                 logger.info("Exiting early - informational query with minimal issues")
@@ -111,18 +120,18 @@ class EarlyExitNode:
         query: str
     ) -> str:
         """Build a response when no issues are found."""
-        response_parts = [f"Based on your query: \"{query}\"\n"]
-
-        response_parts.append("I've analyzed the data and found no significant issues.")
-
-        # Add brief summary from each agent
-        for agent_name, output in agent_results.items():
-            agent_display = agent_name.replace("_", " ").title()
-            response_parts.append(f"\n**{agent_display}**: All metrics within acceptable ranges.")
-
-        response_parts.append("\nEverything looks good! No immediate action required.")
-
-        return "\n".join(response_parts)
+        # Brief summary line per agent
+        agent_lines = "".join(
+            f"\n\n**{_agent_display_name(agent_name)}**: All metrics within acceptable ranges."
+            for agent_name in agent_results
+        )
+
+        return (
+            f"Based on your query: \"{query}\"\n\n"
+            "I've analyzed the data and found no significant issues."
+            f"{agent_lines}\n\n"
+            "Everything looks good! No immediate action required."
+        )
 
 
 # Global instance
@@ -4,12 +4,31 @@ Gate Node - Validates routing decisions and applies business rules.
 This node acts as a gatekeeper that validates queries before they
 proceed to specialist agents.
 """
+import time
 from typing import Dict, Any, List, Optional
+
+from cachetools import TTLCache
+
+from ..core.cache import consume_rate_limit
+from ..core.config import settings
 from ..core.telemetry import get_logger
 
 
 logger = get_logger(__name__)
 
+# Specialist agents the orchestrator can invoke
+_VALID_AGENTS = frozenset({
+    "performance_diagnosis",
+    "budget_risk",
+    "delivery_optimization",
+    "audience_targeting",
+    "creative_inventory"
+})
+
+# Users currently over their limit -> window reset time. Repeat requests from a
+# blocked user are rejected locally until the reset, without a Redis round trip.
+_BLOCKED_USERS: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
 
 class GateNode:
     """
@@ -53,9 +72,9 @@ class GateNode:
         reason = "Validation passed"
 
         # Rule 1: Check query length (just warn, don't block - let clarification flow handle it)
-        words = query.split()
-        if len(words) < self.min_query_length:
-            warnings.append(f"Query is very short ({len(words)} words)")
+        word_count = len(query.split())
+        if word_count < self.min_query_length:
+            warnings.append(f"Query is very short ({word_count} words)")
             # Don't block - the routing agent will handle clarification if needed
 
         # Rule 2: Check number of agents
@@ -69,16 +88,11 @@ class GateNode:
             # Still proceed, but flag it
 
         # Rule 4: Validate agent names
-        valid_agent_names = [
-            "performance_diagnosis",
-            "budget_risk",
-            "delivery_optimization",
-            "audience_targeting",
-            "creative_inventory"
-        ]
-        approved_agents = [a for a in selected_agents if a in valid_agent_names]
-        if len(approved_agents) < len(selected_agents):
-            invalid_agents = [a for a in selected_agents if a not in valid_agent_names]
+        approved_agents = []
+        invalid_agents = []
+        for agent_name in selected_agents:
+            (approved_agents if agent_name in _VALID_AGENTS else invalid_agents).append(agent_name)
+        if invalid_agents:
             warnings.append(f"Invalid agent names removed: {', '.join(invalid_agents)}")
 
         # Rule 5: Check if agents were selected
@@ -104,22 +118,40 @@ class GateNode:
         }
 
 # CURRENTLY NOT USED
-    def check_rate_limit(self, user_id: str) -> Dict[str, Any]:
+    async def check_rate_limit(self, user_id: str) -> Dict[str, Any]:
         """
         Check if user has exceeded rate limits.
 
+        Counts the request against a per-minute Redis window (one atomic
+        Lua call). Users already over the limit are answered from a local
+        cache until their window resets.
+
         Args:
             user_id: User ID
 
         Returns:
             Dict with rate limit status
         """
-        # TODO: Implement actual rate limiting with Redis
-        # For now, always allow
+        limit = settings.rate_limit_requests_per_minute
+
+        reset_time = _BLOCKED_USERS.get(user_id)
+        if reset_time is not None:
+            if reset_time > time.time():
+                return {"allowed": False, "remaining": 0, "reset_time": reset_time}
+            _BLOCKED_USERS.pop(user_id, None)
+
+        current, pttl = await consume_rate_limit(user_id)
+        reset_time = time.time() + max(pttl, 0) / 1000
+
+        allowed = current <= limit
+        if not allowed:
+            _BLOCKED_USERS[user_id] = reset_time
+            logger.warning("Rate limit exceeded", user_id=user_id, requests=current, limit=limit)
+
         return {
-            "allowed": True,
-            "remaining": 100,
-            "reset_time": None
+            "allowed": allowed,
+            "remaining": max(0, limit - current),
+            "reset_time": reset_time
         }
 
 
@@ -5,12 +5,13 @@ Uses ReAct agent to query Snowflake and analyze campaign performance at IO level
 The LLM can construct SQL queries with dates, aggregations, etc. as needed.
 """
 import time
-from langgraph.prebuilt import create_react_agent
+from datetime import date, timedelta
+from functools import lru_cache
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 
 from .base import BaseAgent
 from ..tools.agent_tools import get_performance_agent_tools
-from ..tools.decision_logger import decision_logger
 from ..schemas.agent import AgentOutput, AgentDecisionCreate
 from ..core.telemetry import get_logger
 
@@ -18,44 +19,26 @@ from ..core.telemetry import get_logger
 logger = get_logger(__name__)
 
 
-class PerformanceAgentSimple(BaseAgent):
-    """
-    Performance Agent - Minimal ReAct version.
-
-    Uses ReAct agent to:
-    1. Query Snowflake for IO-level performance data
-    2. Analyze campaign metrics (impressions, clicks, conversions, spend, revenue)
-    3. Provide performance insights and recommendations
-    """
-
-    def __init__(self):
-        """Initialize Performance Agent."""
-        super().__init__(
-            agent_name="performance_diagnosis",
-            description="Analyzes DV360 campaign performance at IO level",
-            tools=[],
-        )
-
-    def get_system_prompt(self) -> str:
-        """Return system prompt."""
-        from datetime import datetime, timedelta
-        now = datetime.now()
-        current_date = now.strftime("%B %d, %Y")
-        current_year = now.year
-        current_day_of_week = now.strftime("%A")  # Monday, Tuesday, etc.
-        
-        # Calculate last full reporting week (Sunday-Saturday)
-        # Find the most recent Saturday
-        days_since_saturday = (now.weekday() + 2) % 7  # Monday=0, so +2 gives days since Saturday
-        if days_since_saturday == 0:  # Today is Saturday
-            days_since_saturday = 7  # Use previous Saturday
-        last_saturday = now - timedelta(days=days_since_saturday)
-        last_sunday = last_saturday - timedelta(days=6)  # Go back 6 days to get Sunday
-        last_full_week_start = last_sunday.strftime("%Y-%m-%d")
-        last_full_week_end = last_saturday.strftime("%Y-%m-%d")
-        last_full_week_display = f"{last_sunday.strftime('%B %d')} - {last_saturday.strftime('%B %d, %Y')}"
-
-        return f"""You are a DV360 Performance Agent specializing in campaign performance analysis for the Quiz advertiser.
+@lru_cache(maxsize=2)
+def _render_system_prompt(day_ordinal: int) -> str:
+    """Render the performance agent system prompt for a given day (memoized)."""
+    now = date.fromordinal(day_ordinal)
+    current_date = now.strftime("%B %d, %Y")
+    current_year = now.year
+    current_day_of_week = now.strftime("%A")  # Monday, Tuesday, etc.
+    
+    # Calculate last full reporting week (Sunday-Saturday)
+    # Find the most recent Saturday
+    days_since_saturday = (now.weekday() + 2) % 7  # Monday=0, so +2 gives days since Saturday
+    if days_since_saturday == 0:  # Today is Saturday
+        days_since_saturday = 7  # Use previous Saturday
+    last_saturday = now - timedelta(days=days_since_saturday)
+    last_sunday = last_saturday - timedelta(days=6)  # Go back 6 days to get Sunday
+    last_full_week_start = last_sunday.strftime("%Y-%m-%d")
+    last_full_week_end = last_saturday.strftime("%Y-%m-%d")
+    last_full_week_display = f"{last_sunday.strftime('%B %d')} - {last_saturday.strftime('%B %d, %Y')}"
+
+    return f"""You are a DV360 Performance Agent specializing in campaign performance analysis for the Quiz advertiser.
 
 IMPORTANT DATE CONTEXT:
 - Current date: {current_date} ({current_day_of_week})
@@ -247,18 +230,35 @@ Always structure your response with:
 
 Be data-driven, precise with DV360 terminology, and provide clear actionable insights."""
 
+
+class PerformanceAgentSimple(BaseAgent):
+    """
+    Performance Agent - Minimal ReAct version.
+
+    Uses ReAct agent to:
+    1. Query Snowflake for IO-level performance data
+    2. Analyze campaign metrics (impressions, clicks, conversions, spend, revenue)
+    3. Provide performance insights and recommendations
+    """
+
+    def __init__(self):
+        """Initialize Performance Agent."""
+        super().__init__(
+            agent_name="performance_diagnosis",
+            description="Analyzes DV360 campaign performance at IO level",
+            tools=[],
+        )
+
+    def get_system_prompt(self) -> str:
+        """Return system prompt (rendered once per day)."""
+        return _render_system_prompt(date.today().toordinal())
+
     async def process(self, input_data) -> AgentOutput:
         """Process input using ReAct agent."""
         start_time = time.time()
 
-        # Get tools (includes execute_custom_snowflake_query)
-        tools = get_performance_agent_tools()
-
-        # Create ReAct agent
-        react_agent = create_react_agent(
-            model=self.llm,
-            tools=tools
-        )
+        # Compiled ReAct agent (built once per tool set, reused across requests)
+        react_agent = self._get_react_agent(get_performance_agent_tools())
 
         # Build messages with conversation history if available
         messages = [SystemMessage(content=self.get_system_prompt())]
@@ -280,7 +280,6 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
 
         # Run agent with system prompt and conversation history
         # Set recursion_limit in config to prevent infinite retry loops
-        from langchain_core.runnables import RunnableConfig
         config = RunnableConfig(recursion_limit=15)  # Limit retries to prevent infinite loops
         
         try:
@@ -306,7 +305,7 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
         # Log decision
         execution_time_ms = int((time.time() - start_time) * 1000)
         if input_data.session_id:
-            await decision_logger.log_decision(AgentDecisionCreate(
+            await self._log_decision(AgentDecisionCreate(
                 session_id=input_data.session_id,
                 agent_name=self.agent_name,
                 decision_type="performance_analysis",
@@ -325,15 +324,15 @@ Be data-driven, precise with DV360 terminology, and provide clear actionable ins
             confidence=0.9
         )
 
-    def _extract_response(self, messages) -> str:
-        """Extract final response from ReAct agent messages."""
-        # Get the last AI message (the final response)
-        for msg in reversed(messages):
-            if hasattr(msg, 'content') and msg.content and hasattr(msg, 'type'):
-                if msg.type == 'ai':
-                    return msg.content
-        return "Analysis complete"
+
+@lru_cache(maxsize=None)
+def get_performance_agent_simple() -> PerformanceAgentSimple:
+    """Return the shared PerformanceAgentSimple, constructing it on first use."""
+    return PerformanceAgentSimple()
 
 
-# Global instance
-performance_agent_simple = PerformanceAgentSimple()
+def __getattr__(name: str):
+    # Global instance, created lazily on first access (PEP 562)
+    if name == "performance_agent_simple":
+        return get_performance_agent_simple()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
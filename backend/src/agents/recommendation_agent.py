@@ -6,8 +6,8 @@ actionable recommendations for the user.
 """
 from typing import Dict, Any, List
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_anthropic import ChatAnthropic
 
+from .base import get_shared_llm
 from ..core.config import settings
 from ..core.telemetry import get_logger
 
@@ -25,9 +25,10 @@ class RecommendationAgent:
 
     def __init__(self):
         """Initialize Recommendation Agent."""
-        self.llm = ChatAnthropic(
-            model=settings.anthropic_model,
-            api_key=settings.anthropic_api_key,
+        self.llm = get_shared_llm(
+            "anthropic",
+            settings.anthropic_model,
+            settings.anthropic_api_key,
             temperature=0.3,  # Lower temperature for faster, more consistent recommendations
         )
 
@@ -51,7 +52,6 @@ class RecommendationAgent:
             - confidence: float - Confidence in recommendations
             - action_plan: str - Summary action plan
         """
-        import json
 
         # Extract context
         root_causes = diagnosis.get("root_causes", [])
@@ -102,7 +102,7 @@ Your recommendations:"""
                 HumanMessage(content=recommendation_prompt)
             ]
 
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             response_text = response.content.strip()
 
             logger.info("Recommendation LLM response", response_preview=response_text[:200])
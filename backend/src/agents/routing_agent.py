@@ -6,14 +6,20 @@ specialist agent(s) using LLM-based decision making.
 """
 from typing import Dict, Any, Optional, List
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_anthropic import ChatAnthropic
 
+from .base import get_shared_llm, render_dated_prompt
 from ..core.config import settings
 from ..core.telemetry import get_logger
 
 
 logger = get_logger(__name__)
 
+# Date line of the routing prompt (rendered once per day via render_dated_prompt)
+_DATE_CONTEXT_TEMPLATE = (
+    "IMPORTANT: The current date is {current_date} (year {current_year}). "
+    "All date references should be interpreted relative to {current_year} unless explicitly stated otherwise."
+)
+
 
 class RoutingAgent:
     """
@@ -25,9 +31,10 @@ class RoutingAgent:
 
     def __init__(self):
         """Initialize Routing Agent."""
-        self.llm = ChatAnthropic(
-            model=settings.anthropic_model,
-            api_key=settings.anthropic_api_key,
+        self.llm = get_shared_llm(
+            "anthropic",
+            settings.anthropic_model,
+            settings.anthropic_api_key,
             temperature=0.0,  # Deterministic routing
         )
 
@@ -51,6 +58,13 @@ class RoutingAgent:
             },
         }
 
+        # Agent descriptions and valid names for the routing prompt (static)
+        self._agents_description = "\n".join(
+            f"- **{agent_name}**: {info['description']}"
+            for agent_name, info in self.specialist_agents.items()
+        )
+        self._valid_agent_names = ", ".join(self.specialist_agents)
+
     async def route(
         self,
         query: str,
@@ -71,13 +85,6 @@ class RoutingAgent:
             - routing_reasoning: Explanation of routing decision
             - confidence: Confidence score (0-1)
         """
-        # Build agent descriptions for LLM
-        agent_list = []
-        for agent_name, info in self.specialist_agents.items():
-            agent_list.append(f"- **{agent_name}**: {info['description']}")
-
-        agents_description = "\n".join(agent_list)
-
         # Build conversation context section
         context_section = ""
         if conversation_history and len(conversation_history) > 0:
@@ -107,17 +114,13 @@ IMPORTANT: The current query may be a follow-up or clarification to the conversa
 """
 
         # Build routing prompt
-        from datetime import datetime
-        current_date = datetime.now().strftime("%B %Y")
-        current_year = datetime.now().year
-
         routing_prompt = f"""You are a routing assistant for a DV360 analysis system. Analyze the user's query and determine which specialist agent(s) should handle it.
 {context_section}
 
-IMPORTANT: The current date is {current_date} (year {current_year}). All date references should be interpreted relative to {current_year} unless explicitly stated otherwise.
+{render_dated_prompt(_DATE_CONTEXT_TEMPLATE)}
 
 Available agents:
-{agents_description}
+{self._agents_description}
 
 User query: "{query}"
 
@@ -132,7 +135,7 @@ REASONING: Brief explanation of why these agents were selected (or why clarifica
 CONFIDENCE: A score from 0.0 to 1.0 indicating confidence in this routing decision
 CLARIFICATION: Only include this line if the query is unclear. Ask a specific question to help understand what the user wants.
 
-Valid agent names: {', '.join(self.specialist_agents.keys())}
+Valid agent names: {self._valid_agent_names}
 
 IMPORTANT: If the query is vague, ambiguous, or you're not sure what the user wants:
 - Set AGENTS to NONE
@@ -180,7 +183,7 @@ Your response:"""
                 HumanMessage(content=routing_prompt)
             ]
 
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             response_text = response.content.strip()
 
             logger.info(
@@ -288,6 +291,23 @@ Your response:"""
             # Fallback to keyword matching
             return self._fallback_keyword_routing(query)
 
+    def match_keywords(self, query: str) -> List[str]:
+        """
+        Return the specialist agents whose routing keywords appear in the query.
+
+        Args:
+            query: User query
+
+        Returns:
+            Matching agent names, in registry order
+        """
+        query_lower = query.lower()
+        return [
+            agent_name
+            for agent_name, info in self.specialist_agents.items()
+            if any(keyword in query_lower for keyword in info.get("keywords", []))
+        ]
+
     def _fallback_keyword_routing(self, query: str) -> Dict[str, Any]:
         """
         Fallback routing using simple keyword matching.
@@ -298,13 +318,7 @@ Your response:"""
         Returns:
             Routing decision dict with clarification_needed flag if query is unclear
         """
-        query_lower = query.lower()
-        selected = []
-
-        for agent_name, info in self.specialist_agents.items():
-            keywords = info.get("keywords", [])
-            if any(keyword in query_lower for keyword in keywords):
-                selected.append(agent_name)
+        selected = self.match_keywords(query)
 
         # If no keywords match, query is unclear - ask for clarification
         if not selected:
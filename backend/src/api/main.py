@@ -1,6 +1,7 @@
 """
 FastAPI application entrypoint.
 """
+import asyncio
 import os
 import uuid
 from contextlib import asynccontextmanager
@@ -19,6 +20,7 @@ from ..core.config import settings
 
 from ..core.database import init_db, close_db, ensure_pgvector_extension
 from ..core.cache import init_redis, close_redis
+from ..agents.base import BaseAgent
 from ..core.telemetry import (
     get_logger,
     set_correlation_id,
@@ -55,6 +57,14 @@ async def lifespan(app: FastAPI):
         # Initialize Redis
         await init_redis()
 
+        # Open LLM connections before the first request (best effort, bounded)
+        if settings.enable_llm_warmup:
+            from ..agents.orchestrator import orchestrator
+            try:
+                await asyncio.wait_for(orchestrator.warmup(), timeout=settings.llm_warmup_timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning("LLM warmup timed out", timeout_seconds=settings.llm_warmup_timeout_seconds)
+
         logger.info("Application startup complete")
     except Exception as e:
         logger.error("Failed to initialize application", error=str(e))
@@ -64,6 +74,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down application")
+    # Flush background decision writes while the database is still open
+    await BaseAgent.shutdown()
     await close_db()
     await close_redis()
     logger.info("Application shutdown complete")
@@ -306,6 +306,101 @@ async def send_message_stream(request: ChatRequest):
     )
 
 
+@router.post("/stream/response", status_code=status.HTTP_200_OK)
+async def send_message_stream_response(request: ChatRequest):
+    """
+    Send a message and stream the final response text via Server-Sent Events (SSE).
+
+    Unlike /stream, which reports orchestrator progress and delivers the
+    response at the end, this endpoint sends the Markdown response in
+    fragments as the orchestrator produces them:
+    - chunk events: {"type": "chunk", "content": "..."}
+    - complete event: {"type": "complete", "data": {"session_id": "...", "execution_time_ms": ...}}
+    - error event: {"type": "error", "message": "..."}
+
+    Args:
+        request: Chat request with message, session_id, and user_id
+
+    Returns:
+        StreamingResponse with SSE events
+    """
+    start_time = time.time()
+
+    # Resolve the session before streaming so a bad id is still a 404
+    if request.session_id:
+        session = await session_manager.get_session_info(request.session_id)
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session {request.session_id} not found"
+            )
+        session_id = request.session_id
+    else:
+        session_id = await session_manager.create_session(
+            user_id=request.user_id,
+            metadata=request.context
+        )
+        logger.info(f"Created new session for response streaming: {session_id}")
+
+    async def event_generator():
+        try:
+            # Save user message to history
+            await session_manager.add_message(ChatMessageCreate(
+                session_id=session_id,
+                role="user",
+                content=request.message,
+                agent_name=None,
+                metadata={}
+            ))
+
+            agent_input = AgentInput(
+                message=request.message,
+                session_id=session_id,
+                user_id=request.user_id,
+                context=request.context,
+            )
+
+            fragments = []
+            async for fragment in orchestrator.stream(agent_input):
+                fragments.append(fragment)
+                yield f"data: {json.dumps({'type': 'chunk', 'content': fragment})}\n\n"
+
+            execution_time_ms = int((time.time() - start_time) * 1000)
+
+            # Save assistant response to history
+            await session_manager.add_message(ChatMessageCreate(
+                session_id=session_id,
+                role="assistant",
+                content="".join(fragments),
+                agent_name=orchestrator.agent_name,
+                metadata={"execution_time_ms": execution_time_ms, "streamed": True}
+            ))
+
+            logger.info(
+                "Response streaming request completed",
+                session_id=str(session_id),
+                user_id=request.user_id,
+                execution_time_ms=execution_time_ms,
+            )
+
+            complete = {"session_id": str(session_id), "execution_time_ms": execution_time_ms}
+            yield f"data: {json.dumps({'type': 'complete', 'data': complete})}\n\n"
+
+        except Exception as e:
+            logger.error("Response streaming request failed", error_message=str(e))
+            yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to process message: {str(e)}'})}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx/proxy buffering
+        }
+    )
+
+
 @router.post("/sessions", response_model=SessionInfo, status_code=status.HTTP_201_CREATED)
 async def create_session(request: SessionCreate):
     """
@@ -2,7 +2,7 @@
 Redis cache management for session state and query caching.
 """
 import json
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 from redis import asyncio as aioredis
 from datetime import timedelta
 
@@ -139,17 +139,65 @@ async def invalidate_all_query_cache() -> None:
         await redis.delete(*keys)
 
 
+# Orchestrator Response Cache
+async def set_response_cache(cache_key: str, response: dict, ttl_seconds: Optional[int] = None) -> None:
+    """Cache a serialized orchestrator response."""
+    ttl = ttl_seconds or settings.orchestrator_response_cache_ttl_seconds
+    redis = await get_redis()
+
+    await redis.setex(
+        f"response:{cache_key}",
+        timedelta(seconds=ttl),
+        json.dumps(response)
+    )
+
+
+async def get_response_cache(cache_key: str) -> Optional[dict]:
+    """Retrieve a cached orchestrator response."""
+    redis = await get_redis()
+    data = await redis.get(f"response:{cache_key}")
+
+    if data:
+        return json.loads(data)
+    return None
+
+
 # Rate Limiting
-async def check_rate_limit(user_id: str, limit_per_minute: Optional[int] = None) -> bool:
-    """Check if user is within rate limit."""
-    limit = limit_per_minute or settings.rate_limit_requests_per_minute
+# Fixed-window counter: increment, start the window on first hit, and return the
+# count with the window's remaining ms - atomically, in one round trip
+_RATE_LIMIT_LUA = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return {current, redis.call('PTTL', KEYS[1])}
+"""
+_rate_limit_script = None
+
+
+async def consume_rate_limit(user_id: str, window_ms: int = 60_000) -> Tuple[int, int]:
+    """
+    Count one request against the user's rate-limit window.
+
+    Runs via EVALSHA (redis-py loads the script on first use).
+
+    Returns:
+        (requests in the current window, milliseconds until the window resets)
+    """
+    global _rate_limit_script
+
     redis = await get_redis()
+    if _rate_limit_script is None or _rate_limit_script.registered_client is not redis:
+        _rate_limit_script = redis.register_script(_RATE_LIMIT_LUA)
+
+    current, pttl = await _rate_limit_script(keys=[f"ratelimit:{user_id}:minute"], args=[window_ms])
+    return int(current), int(pttl)
 
-    key = f"ratelimit:{user_id}:minute"
-    current = await redis.incr(key)
 
-    if current == 1:
-        await redis.expire(key, 60)
+async def check_rate_limit(user_id: str, limit_per_minute: Optional[int] = None) -> bool:
+    """Check if user is within rate limit."""
+    limit = limit_per_minute or settings.rate_limit_requests_per_minute
+    current, _ = await consume_rate_limit(user_id)
 
     return current <= limit
 
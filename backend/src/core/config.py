@@ -102,6 +102,26 @@ class Settings(BaseSettings):
     # Query Caching
     query_cache_ttl_minutes: int = Field(default=60, description="Query cache TTL in minutes")
     enable_query_cache: bool = Field(default=True, description="Enable query caching")
+    query_local_cache_ttl_seconds: int = Field(default=300, description="In-process query cache TTL in seconds (0 disables)")
+    query_local_cache_max_entries: int = Field(default=128, description="Max query results held in the in-process cache")
+
+    # LLM Response Caching
+    enable_llm_response_cache: bool = Field(default=True, description="Cache LLM responses for identical prompts")
+    llm_response_cache_ttl_seconds: int = Field(default=300, description="LLM response cache TTL in seconds")
+    routing_cache_ttl_seconds: int = Field(default=3600, description="Routing decision cache TTL in seconds")
+    enable_orchestrator_response_cache: bool = Field(
+        default=False,
+        description="Serve repeated orchestrator queries (same query and recent history) from Redis"
+    )
+    orchestrator_response_cache_ttl_seconds: int = Field(
+        default=3600,
+        description="Orchestrator response cache TTL in seconds"
+    )
+    enable_creative_response_cache: bool = Field(
+        default=False,
+        description="Serve repeated standalone creative queries from an in-process cache (keyed on the query, "
+                    "not the underlying data, so answers can be up to llm_response_cache_ttl_seconds stale)"
+    )
 
     # Rate Limiting
     rate_limit_requests_per_minute: int = Field(default=60, description="Rate limit: requests per minute")
@@ -110,6 +130,28 @@ class Settings(BaseSettings):
     # Agent Configuration
     max_agent_execution_time_seconds: int = Field(default=120, description="Max agent execution time")
     enable_parallel_agent_execution: bool = Field(default=True, description="Enable parallel agent execution")
+    max_concurrent_agent_invocations: int = Field(
+        default=16,
+        description="Process-wide cap on specialist agents running at once"
+    )
+    orchestrator_include_reasoning: bool = Field(
+        default=True,
+        description="Record per-node reasoning steps in orchestrator responses"
+    )
+    enable_orchestrator_request_coalescing: bool = Field(
+        default=False,
+        description="Share one orchestrator run between identical concurrent requests in a session"
+    )
+    enable_llm_warmup: bool = Field(default=True, description="Warm up LLM connections at startup")
+    llm_warmup_timeout_seconds: float = Field(default=15.0, description="Max time startup waits for LLM warmup")
+    enable_orchestrator_fast_path: bool = Field(
+        default=False,
+        description="Answer clear single-agent informational queries without the routing LLM and full graph"
+    )
+    diagnosis_skip_confidence: Optional[float] = Field(
+        default=None,
+        description="Skip the diagnosis LLM call when mean agent confidence reaches this value (unset disables)"
+    )
 
     # Telemetry & Monitoring
     log_level: str = Field(default="INFO", description="Log level")
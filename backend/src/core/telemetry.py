@@ -27,8 +27,10 @@ def set_correlation_id(correlation_id: str) -> None:
 def setup_logging() -> None:
     """Configure structured logging with structlog."""
 
-    # Processors for structlog
+    # Processors for structlog. filter_by_level runs first so calls below the
+    # configured level are dropped before any processing or rendering.
     shared_processors = [
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
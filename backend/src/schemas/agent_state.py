@@ -4,6 +4,7 @@ State definitions for LangGraph agents.
 These TypedDict classes define the state schema that flows through
 agent nodes in LangGraph workflows.
 """
+from dataclasses import dataclass
 from typing import TypedDict, Optional, List, Dict, Any, Annotated
 from uuid import UUID
 from datetime import datetime
@@ -62,6 +63,7 @@ class OrchestratorState(TypedDict):
     # Context
     session_history: List[Dict[str, Any]]
     conversation_history: List[Dict[str, Any]]  # Recent conversation messages for context
+    history_loaded: bool  # conversation_history was fetched before the graph ran
     relevant_learnings: List[Dict[str, Any]]
 
     # Routing phase
@@ -84,6 +86,7 @@ class OrchestratorState(TypedDict):
     diagnosis: Dict[str, Any]  # Root cause analysis
     correlations: List[str]  # Cross-agent correlations
     severity_assessment: str  # critical, high, medium, low
+    is_follow_up: bool  # Query answers a clarification question
 
     # Early exit check
     should_exit_early: bool
@@ -105,9 +108,39 @@ class OrchestratorState(TypedDict):
     # Tracking
     tools_used: Annotated[List[str], operator.add]
     reasoning_steps: Annotated[List[str], operator.add]
+    include_reasoning: bool  # Whether nodes record reasoning_steps
     execution_time_ms: int
 
 
+@dataclass(slots=True)
+class ResponseView:
+    """
+    Read-only view of the OrchestratorState fields used to assemble the final response.
+
+    Built once per request so response formatting uses attribute access
+    instead of repeated state lookups. All fields are set by
+    create_initial_orchestrator_state, so they are read directly.
+    """
+    query: str
+    diagnosis: Dict[str, Any]
+    validated_recommendations: List[Dict[str, str]]
+    validation_warnings: List[str]
+    recommendation_confidence: float
+    is_follow_up: bool
+
+    @classmethod
+    def from_state(cls, state: OrchestratorState) -> "ResponseView":
+        """Build a view from orchestrator state."""
+        return cls(
+            query=state["query"],
+            diagnosis=state["diagnosis"],
+            validated_recommendations=state["validated_recommendations"],
+            validation_warnings=state["validation_warnings"],
+            recommendation_confidence=state["recommendation_confidence"],
+            is_follow_up=state["is_follow_up"],
+        )
+
+
 # ============================================================================
 # Specialist Agent States
 # ============================================================================
@@ -432,7 +465,8 @@ def create_initial_conductor_state(
 def create_initial_orchestrator_state(
     query: str,
     session_id: Optional[UUID],
-    user_id: str
+    user_id: str,
+    include_reasoning: bool = True
 ) -> OrchestratorState:
     """Create initial state for Orchestrator agent (RouteFlow)."""
     return OrchestratorState(
@@ -441,6 +475,7 @@ def create_initial_orchestrator_state(
         user_id=user_id,
         session_history=[],
         conversation_history=[],
+        history_loaded=False,
         relevant_learnings=[],
         routing_decision={},
         routing_confidence=0.0,
@@ -455,6 +490,7 @@ def create_initial_orchestrator_state(
         diagnosis={},
         correlations=[],
         severity_assessment="",
+        is_follow_up=False,
         should_exit_early=False,
         early_exit_reason=None,
         recommendations=[],
@@ -466,6 +502,7 @@ def create_initial_orchestrator_state(
         confidence=0.0,
         tools_used=[],
         reasoning_steps=[],
+        include_reasoning=include_reasoning,
         execution_time_ms=0,
     )
 
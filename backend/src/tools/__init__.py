@@ -8,6 +8,7 @@ from .decision_logger import decision_logger, DecisionLogger
 # New LangChain-compatible tools
 from .snowflake_tools import (
     execute_custom_snowflake_query,
+    query_audience_performance,
     ALL_SNOWFLAKE_TOOLS,
 )
 from .memory_tools import (
@@ -34,6 +35,7 @@ __all__ = [
     "DecisionLogger",
     # New LangChain tools
     "execute_custom_snowflake_query",
+    "query_audience_performance",
     "retrieve_relevant_learnings",
     "get_session_history",
     # Tool collections
@@ -9,6 +9,7 @@ from langchain_core.tools import BaseTool
 
 from .snowflake_tools import (
     execute_custom_snowflake_query,
+    query_audience_performance,
     ALL_SNOWFLAKE_TOOLS,
 )
 from .memory_tools import (
@@ -90,6 +91,7 @@ def get_delivery_agent_tools() -> List[BaseTool]:
     """
     return [
         execute_custom_snowflake_query,  # Primary tool - build SQL queries for creative and audience data
+        query_audience_performance,  # Line item totals aggregated in Snowflake
         retrieve_relevant_learnings,
         get_session_history,
     ]
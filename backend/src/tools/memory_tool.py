@@ -1,6 +1,7 @@
 """
 Memory retrieval tool for agents to access relevant past learnings and context.
 """
+import asyncio
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
@@ -56,35 +57,44 @@ class MemoryRetrievalTool:
             query_preview=query[:50],
         )
 
-        # 1. Get relevant learnings via semantic search
-        relevant_learnings = await vector_store.search_similar(
-            query=query,
-            agent_name=None,  # Search across all agents
-            top_k=top_k,
-            min_similarity=min_similarity,
-        )
+        # 1 + 2. Semantic search and recent session history are independent
+        # (separate pool connections), so run them concurrently
+        if include_session_history:
+            relevant_learnings, messages_objs = await asyncio.gather(
+                vector_store.search_similar(
+                    query=query,
+                    agent_name=None,  # Search across all agents
+                    top_k=top_k,
+                    min_similarity=min_similarity,
+                ),
+                session_manager.get_messages(
+                    session_id=session_id,
+                    limit=max_history_messages,
+                ),
+            )
+        else:
+            relevant_learnings = await vector_store.search_similar(
+                query=query,
+                agent_name=None,  # Search across all agents
+                top_k=top_k,
+                min_similarity=min_similarity,
+            )
+            messages_objs = []
 
         logger.info(
             "Retrieved semantic memories",
             count=len(relevant_learnings),
         )
 
-        # 2. Get recent session history
-        messages = []
-        if include_session_history:
-            messages_objs = await session_manager.get_messages(
-                session_id=session_id,
-                limit=max_history_messages,
-            )
-            messages = [
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                    "agent_name": msg.agent_name,
-                    "timestamp": msg.timestamp.isoformat(),
-                }
-                for msg in messages_objs
-            ]
+        messages = [
+            {
+                "role": msg.role,
+                "content": msg.content,
+                "agent_name": msg.agent_name,
+                "timestamp": msg.timestamp.isoformat(),
+            }
+            for msg in messages_objs
+        ]
 
         logger.info(
             "Retrieved session history",
@@ -4,7 +4,7 @@ LangChain-compatible memory retrieval tools.
 These tools allow agents to access past learnings and session context.
 """
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 import json
 from langchain_core.tools import tool
 
@@ -47,7 +47,6 @@ async def retrieve_relevant_learnings(
 
         # Note: We need to create a temporary session ID for tool-only calls
         # In practice, the agent will have a session_id in its state
-        from uuid import uuid4
         temp_session_id = uuid4()
 
         context = await memory_retrieval_tool.retrieve_context(
@@ -105,7 +104,6 @@ async def get_session_history(
             limit=limit
         )
 
-        from uuid import UUID
         session_uuid = UUID(session_id)
 
         context = await memory_retrieval_tool.retrieve_context(
@@ -2,11 +2,15 @@
 Snowflake tool for querying DV360 data.
 """
 from typing import Dict, Any, List, Optional
+import functools
 import hashlib
 import time
 import asyncio
+from datetime import date, datetime
+from decimal import Decimal
 from concurrent.futures import ThreadPoolExecutor
 
+from cachetools import TTLCache
 import snowflake.connector
 from snowflake.connector import DictCursor
 from langchain_core.tools import tool
@@ -21,6 +25,29 @@ logger = get_logger(__name__)
 # Thread pool for sync Snowflake connector
 executor = ThreadPoolExecutor(max_workers=5)
 
+# In-process L1 in front of the Redis query cache, keyed by query hash.
+# Cached row lists are shared between callers and must be treated as read-only.
+_local_query_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=settings.query_local_cache_max_entries, ttl=settings.query_local_cache_ttl_seconds)
+    if settings.enable_query_cache and settings.query_local_cache_ttl_seconds > 0
+    else None
+)
+
+# Futures for cached queries currently running, keyed by query hash (single-flight)
+_inflight_queries: Dict[str, "asyncio.Future[List[Dict[str, Any]]]"] = {}
+
+
+def _finish_inflight_query(query_hash: str, future: "asyncio.Future[List[Dict[str, Any]]]") -> None:
+    """
+    Drop a finished single-flight query and log its failure.
+
+    Retrieving the exception here means a query whose callers were all
+    cancelled doesn't trigger "Future exception was never retrieved".
+    """
+    _inflight_queries.pop(query_hash, None)
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Shared query failed", query_hash=query_hash, error_message=str(future.exception()))
+
 
 class SnowflakeTool:
     """
@@ -119,8 +146,6 @@ class SnowflakeTool:
 
     def _execute_query_sync(self, query: str) -> List[Dict[str, Any]]:
         """Execute query synchronously."""
-        from datetime import date, datetime
-        from decimal import Decimal
         
         conn = None
         try:
@@ -157,23 +182,61 @@ class SnowflakeTool:
         """
         Execute a Snowflake query asynchronously.
 
+        Concurrent cached calls for the same query are coalesced: the first
+        caller runs it and the others await that result (single-flight).
+
         Args:
             query: SQL query to execute
-            use_cache: Whether to use query cache
+            use_cache: Whether to use the query caches (in-process, then Redis).
+                Pass False to force a fresh read from Snowflake.
 
         Returns:
             List of result dictionaries
         """
-        start_time = time.time()
+        if not use_cache:
+            return await self._run_query(query)
 
         # Check cache
         query_hash = hashlib.sha256(query.encode()).hexdigest()
-        if use_cache:
-            cached = await get_query_cache(query_hash)
-            if cached:
-                logger.info("Query cache hit", query_hash=query_hash)
+        if _local_query_cache is not None:
+            cached = _local_query_cache.get(query_hash)
+            if cached is not None:
+                logger.info("Query local cache hit", query_hash=query_hash)
                 return cached
 
+        inflight = _inflight_queries.get(query_hash)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._execute_cached_query(query, query_hash))
+            _inflight_queries[query_hash] = inflight
+            inflight.add_done_callback(functools.partial(_finish_inflight_query, query_hash))
+        else:
+            logger.info("Joining in-flight query", query_hash=query_hash)
+
+        # Shield so one caller's cancellation doesn't cancel the shared query
+        return await asyncio.shield(inflight)
+
+    async def _execute_cached_query(self, query: str, query_hash: str) -> List[Dict[str, Any]]:
+        """Serve a query from the Redis cache, or run it and populate both cache tiers."""
+        cached = await get_query_cache(query_hash)
+        if cached:
+            logger.info("Query cache hit", query_hash=query_hash)
+            if _local_query_cache is not None:
+                _local_query_cache[query_hash] = cached
+            return cached
+
+        results = await self._run_query(query)
+
+        # Cache results
+        if _local_query_cache is not None:
+            _local_query_cache[query_hash] = results
+        await set_query_cache(query_hash, results)
+
+        return results
+
+    async def _run_query(self, query: str) -> List[Dict[str, Any]]:
+        """Run a query on the Snowflake thread pool, bypassing all caches."""
+        start_time = time.time()
+
         # Execute query in thread pool (Snowflake connector is sync)
         try:
             logger.info("Executing Snowflake query", query_preview=query[:100])
@@ -192,10 +255,6 @@ class SnowflakeTool:
                 result_count=len(results)
             )
 
-            # Cache results
-            if use_cache:
-                await set_query_cache(query_hash, results)
-
             return results
 
         except Exception as e:
@@ -207,5 +266,45 @@ class SnowflakeTool:
             )
             raise
 
+    async def get_audience_aggregated(
+        self,
+        advertiser: str = "Quiz",
+        min_impressions: int = 0,
+        lookback_days: int = 30,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get audience (line item) performance aggregated in Snowflake.
+
+        The GROUP BY runs in the warehouse so only one row per line item is
+        transferred. The query text depends only on the arguments, so repeat
+        calls hit both the Redis query cache and Snowflake's result cache.
+
+        Args:
+            advertiser: Advertiser name to filter on
+            min_impressions: Drop line items with fewer total impressions
+            lookback_days: Number of days of history to aggregate
+
+        Returns:
+            One dict per line item with LINE_ITEM, IMPRESSIONS, CLICKS,
+            TOTAL_CONVERSIONS, SPEND and TOTAL_REVENUE keys. Metrics are
+            COALESCEd in SQL, so values are always numeric (never None).
+        """
+        advertiser_literal = advertiser.replace("'", "''")
+        query = (
+            "SELECT COALESCE(LINE_ITEM, 'Unknown') AS LINE_ITEM, "
+            "COALESCE(SUM(IMPRESSIONS), 0) AS IMPRESSIONS, "
+            "COALESCE(SUM(CLICKS), 0) AS CLICKS, "
+            "COALESCE(SUM(TOTAL_CONVERSIONS_PM), 0) AS TOTAL_CONVERSIONS, "
+            "COALESCE(SUM(SPEND_GBP), 0) AS SPEND, "
+            "COALESCE(SUM(TOTAL_REVENUE_GBP_PM), 0) AS TOTAL_REVENUE "
+            "FROM reports.reporting_revamp.ALL_PERFORMANCE_AGG "
+            f"WHERE ADVERTISER = '{advertiser_literal}' "
+            f"AND DATE >= DATEADD(day, -{int(lookback_days)}, CURRENT_DATE) "
+            "GROUP BY 1 "
+            f"HAVING COALESCE(SUM(IMPRESSIONS), 0) >= {int(min_impressions)} "
+            "ORDER BY 2 DESC"
+        )
+        return await self.execute_query(query)
+
 # Global instance
 snowflake_tool = SnowflakeTool()
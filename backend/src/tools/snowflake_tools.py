@@ -15,6 +15,14 @@ from ..core.telemetry import get_logger
 
 logger = get_logger(__name__)
 
+# Precompiled patterns for normalize_sql_column_names (called on every custom query)
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_SELECT_CLAUSE_RE = re.compile(r'SELECT\s+(.*?)\s+FROM', re.IGNORECASE | re.DOTALL)
+_GROUP_BY_CLAUSE_RE = re.compile(
+    r'GROUP\s+BY\s+(.*?)(?:\s+ORDER\s+BY|\s+HAVING|\s+$|$)', re.IGNORECASE | re.DOTALL
+)
+_ORDER_BY_CLAUSE_RE = re.compile(r'ORDER\s+BY\s+(.*?)(?:\s+LIMIT|$)', re.IGNORECASE | re.DOTALL)
+
 
 def normalize_sql_column_names(query: str) -> str:
     """
@@ -64,36 +72,21 @@ def normalize_sql_column_names(query: str) -> str:
             elif char == ')':
                 paren_depth -= 1
                 result.append(char)
-            elif re.match(r'[A-Za-z_]', char):
-                # Start of identifier - collect the whole identifier
-                start = i
-                while i < len(text) and re.match(r'[A-Za-z0-9_]', text[i]):
-                    i += 1
-                identifier = text[start:i]
-                
-                # Check if it's a SQL keyword or function (keep uppercase)
-                sql_keywords = {
-                    'SELECT', 'FROM', 'WHERE', 'GROUP', 'BY', 'ORDER', 'AS', 'AND', 'OR',
-                    'SUM', 'COUNT', 'AVG', 'MAX', 'MIN', 'EXTRACT', 'DATEADD', 'DATEDIFF',
-                    'CURRENT_DATE', 'CURRENT_TIMESTAMP', 'ROUND', 'NULLIF', 'COALESCE',
-                    'CASE', 'WHEN', 'THEN', 'ELSE', 'END', 'ASC', 'DESC', 'HAVING',
-                    'LIMIT', 'OFFSET', 'DISTINCT'
-                }
-                if identifier.upper() in sql_keywords:
-                    result.append(identifier.upper())
-                else:
-                    # Column name - uppercase it
-                    result.append(identifier.upper())
-                i -= 1  # Adjust because we'll increment in the loop
             else:
-                result.append(char)
+                identifier_match = _IDENTIFIER_RE.match(text, i)
+                if identifier_match:
+                    # Identifier (column, keyword or function) - uppercase the whole token
+                    result.append(identifier_match.group(0).upper())
+                    i = identifier_match.end() - 1  # Adjust because we'll increment in the loop
+                else:
+                    result.append(char)
             
             i += 1
         
         return ''.join(result)
     
     # Normalize SELECT clause
-    select_match = re.search(r'SELECT\s+(.*?)\s+FROM', normalized_query, re.IGNORECASE | re.DOTALL)
+    select_match = _SELECT_CLAUSE_RE.search(normalized_query)
     if select_match:
         select_clause = select_match.group(1)
         normalized_select = uppercase_identifiers_in_text(select_clause)
@@ -104,7 +97,7 @@ def normalize_sql_column_names(query: str) -> str:
         )
     
     # Normalize GROUP BY clause
-    group_by_match = re.search(r'GROUP\s+BY\s+(.*?)(?:\s+ORDER\s+BY|\s+HAVING|\s+$|$)', normalized_query, re.IGNORECASE | re.DOTALL)
+    group_by_match = _GROUP_BY_CLAUSE_RE.search(normalized_query)
     if group_by_match:
         group_by_clause = group_by_match.group(1).strip()
         normalized_group_by = uppercase_identifiers_in_text(group_by_clause)
@@ -115,7 +108,7 @@ def normalize_sql_column_names(query: str) -> str:
         )
     
     # Normalize ORDER BY clause
-    order_by_match = re.search(r'ORDER\s+BY\s+(.*?)(?:\s+LIMIT|$)', normalized_query, re.IGNORECASE | re.DOTALL)
+    order_by_match = _ORDER_BY_CLAUSE_RE.search(normalized_query)
     if order_by_match:
         order_by_clause = order_by_match.group(1).strip()
         normalized_order_by = uppercase_identifiers_in_text(order_by_clause)
@@ -226,8 +219,56 @@ async def execute_custom_snowflake_query(query: str) -> str:
         return json.dumps(error_response)
 
 
+@tool
+async def query_audience_performance(
+    advertiser: str = "Quiz",
+    min_impressions: int = 0,
+    lookback_days: int = 30,
+) -> str:
+    """
+    Get audience (line item) performance totals, aggregated in Snowflake.
+
+    Returns one row per line item with summed IMPRESSIONS, CLICKS, TOTAL_CONVERSIONS,
+    SPEND (GBP) and TOTAL_REVENUE (GBP). Prefer this over a custom query when you only
+    need per-line-item totals for audience analysis.
+
+    Args:
+        advertiser: Advertiser name (default 'Quiz')
+        min_impressions: Exclude line items with fewer total impressions
+        lookback_days: Number of days of history to aggregate (default 30)
+
+    Returns:
+        JSON string with one record per line item
+    """
+    try:
+        logger.info(
+            "LLM calling query_audience_performance",
+            advertiser=advertiser,
+            min_impressions=min_impressions,
+            lookback_days=lookback_days
+        )
+
+        results = await snowflake_tool.get_audience_aggregated(
+            advertiser=advertiser,
+            min_impressions=min_impressions,
+            lookback_days=lookback_days,
+        )
+
+        return json.dumps(results, default=str)
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error("query_audience_performance failed", error=error_msg)
+        return json.dumps({
+            "error": True,
+            "error_type": type(e).__name__,
+            "error_message": error_msg,
+        })
+
+
 # Export all tools as a list for easy agent registration
-# NOTE: Only execute_custom_snowflake_query is available - agents build SQL queries themselves
+# NOTE: execute_custom_snowflake_query is the primary tool - agents build SQL queries themselves
 ALL_SNOWFLAKE_TOOLS = [
     execute_custom_snowflake_query,
+    query_audience_performance,
 ]
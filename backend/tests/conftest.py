@@ -0,0 +1,105 @@
+"""
+Shared pytest fixtures.
+
+Agents build their LLM clients at import time, which only needs a key to be
+configured; no test talks to a provider.
+"""
+import os
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+
+class FakeClock:
+    """Manually advanced clock, in seconds."""
+
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the redis.asyncio client.
+
+    Implements the commands the cache module uses, with key expiry driven by
+    a FakeClock. Scripts registered with register_script are dispatched by
+    their source, so only known scripts can run.
+    """
+
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.store: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self.script_calls = 0
+
+    def _live(self, key: str) -> Optional[Any]:
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock.time():
+            del self.store[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._live(key)
+
+    async def setex(self, key: str, ttl: Any, value: Any) -> None:
+        seconds = ttl.total_seconds() if isinstance(ttl, timedelta) else ttl
+        self.store[key] = (value, self.clock.time() + seconds)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+    def register_script(self, script: str) -> "FakeScript":
+        return FakeScript(self, script)
+
+    def eval_rate_limit(self, keys: List[str], args: List[Any]) -> List[int]:
+        """Apply _RATE_LIMIT_LUA: INCR, PEXPIRE on the first hit, then PTTL."""
+        key = keys[0]
+        current = (self._live(key) or 0) + 1
+        expires_at = self.store[key][1] if current > 1 else self.clock.time() + int(args[0]) / 1000
+        self.store[key] = (current, expires_at)
+        return [current, int(round((expires_at - self.clock.time()) * 1000))]
+
+
+class FakeScript:
+    """Registered script handle, mirroring redis.commands.core.AsyncScript."""
+
+    def __init__(self, client: FakeRedis, script: str):
+        self.registered_client = client
+        self.script = script
+
+    async def __call__(self, keys: List[str], args: List[Any]) -> List[int]:
+        from src.core import cache
+
+        self.registered_client.script_calls += 1
+        if self.script == cache._RATE_LIMIT_LUA:
+            return self.registered_client.eval_rate_limit(keys, args)
+        raise NotImplementedError("FakeRedis cannot run this script")
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch, clock) -> FakeRedis:
+    """Install a FakeRedis as the cache module's client."""
+    from src.core import cache
+
+    client = FakeRedis(clock)
+    monkeypatch.setattr(cache, "redis_client", client)
+    monkeypatch.setattr(cache, "_rate_limit_script", None)
+    return client
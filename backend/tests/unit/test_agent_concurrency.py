@@ -0,0 +1,163 @@
+"""
+Tests for concurrent agent invocation and Snowflake query single-flight.
+"""
+import asyncio
+import gc
+import importlib
+
+import pytest
+
+from src.agents.base import BaseAgent
+from src.core.config import settings
+from src.schemas.agent import AgentInput, AgentOutput
+
+snowflake_module = importlib.import_module("src.tools.snowflake_tool")
+
+
+class StubAgent:
+    """Agent double that records how many invocations overlap."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, name: str, fail: bool = False):
+        self.agent_name = name
+        self.fail = fail
+
+    async def invoke(self, input_data: AgentInput) -> AgentOutput:
+        StubAgent.active += 1
+        StubAgent.peak = max(StubAgent.peak, StubAgent.active)
+        try:
+            await asyncio.sleep(0.001)
+            if self.fail:
+                raise RuntimeError(f"{self.agent_name} failed")
+            return AgentOutput(response=f"{self.agent_name} ok", agent_name=self.agent_name)
+        finally:
+            StubAgent.active -= 1
+
+
+@pytest.fixture
+def agent_input():
+    return AgentInput(message="why is cpa high", user_id="u1")
+
+
+@pytest.fixture(autouse=True)
+def reset_stub_agents():
+    StubAgent.active = StubAgent.peak = 0
+
+
+async def test_invoke_many_returns_results_in_order(agent_input):
+    agents = [StubAgent("a"), StubAgent("b", fail=True), StubAgent("c")]
+
+    results = await BaseAgent.invoke_many(agents, agent_input)
+
+    assert results[0].response == "a ok"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2].response == "c ok"
+
+
+async def test_invoke_many_respects_concurrency_cap(monkeypatch, agent_input):
+    monkeypatch.setattr(settings, "enable_parallel_agent_execution", True)
+    monkeypatch.setattr(BaseAgent, "_invoke_semaphore", asyncio.Semaphore(2))
+
+    await BaseAgent.invoke_many([StubAgent(str(i)) for i in range(5)], agent_input)
+
+    assert StubAgent.peak == 2
+
+
+async def test_invoke_many_callback_failure_keeps_result(agent_input):
+    completed = []
+
+    async def on_complete(index, output):
+        completed.append(index)
+        raise RuntimeError("callback failed")
+
+    results = await BaseAgent.invoke_many([StubAgent("a"), StubAgent("b")], agent_input, on_complete=on_complete)
+
+    assert sorted(completed) == [0, 1]
+    assert [result.response for result in results] == ["a ok", "b ok"]
+
+
+async def test_invoke_many_callback_runs_outside_semaphore(monkeypatch, agent_input):
+    semaphore = asyncio.Semaphore(1)
+    monkeypatch.setattr(settings, "enable_parallel_agent_execution", True)
+    monkeypatch.setattr(BaseAgent, "_invoke_semaphore", semaphore)
+    slots_free = []
+
+    async def on_complete(index, output):
+        slots_free.append(not semaphore.locked())
+
+    await BaseAgent.invoke_many([StubAgent("a")], agent_input, on_complete=on_complete)
+
+    assert slots_free == [True]
+
+
+@pytest.fixture
+def snowflake(monkeypatch):
+    """Snowflake tool with the local cache off and the cached-query path stubbed."""
+    tool = snowflake_module.snowflake_tool
+    monkeypatch.setattr(snowflake_module, "_local_query_cache", None)
+    calls = []
+    release = asyncio.Event()
+
+    async def execute_cached_query(query, query_hash):
+        calls.append(query)
+        await release.wait()
+        if query == "select error":
+            raise RuntimeError("snowflake down")
+        return [{"query": query}]
+
+    monkeypatch.setattr(tool, "_execute_cached_query", execute_cached_query)
+    yield tool, calls, release
+    assert not snowflake_module._inflight_queries
+
+
+async def test_concurrent_identical_queries_run_once(snowflake):
+    tool, calls, release = snowflake
+
+    tasks = [asyncio.create_task(tool.execute_query(query)) for query in ("select 1", "select 1", "select 2")]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert sorted(calls) == ["select 1", "select 2"]
+    assert results[0] == results[1] == [{"query": "select 1"}]
+
+
+async def test_shared_query_failure_reaches_every_caller(snowflake):
+    tool, calls, release = snowflake
+
+    tasks = [asyncio.create_task(tool.execute_query("select error")) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert calls == ["select error"]
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelled_caller_does_not_leak_unretrieved_exception(snowflake):
+    tool, calls, release = snowflake
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context["message"]))
+
+    try:
+        caller = asyncio.create_task(tool.execute_query("select error"))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert caller.cancelled()
+
+        # The cancelled caller's traceback holds the shared future; drop it so
+        # the future is collected and asyncio would report an unretrieved error
+        del caller
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert calls == ["select error"]
+    assert unhandled == []
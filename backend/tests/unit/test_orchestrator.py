@@ -0,0 +1,228 @@
+"""
+Tests for orchestrator request coalescing, progress delivery and cache keys.
+
+The graph itself is stubbed out: these tests exercise the concurrency and
+caching plumbing around it.
+"""
+import asyncio
+import importlib
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.core.config import settings
+from src.schemas.agent import AgentInput, AgentOutput
+
+orchestrator_module = importlib.import_module("src.agents.orchestrator")
+orchestrator = orchestrator_module.orchestrator
+
+
+def _make_input(message: str, user_id: str = "u1", session_id=None) -> AgentInput:
+    return AgentInput(message=message, user_id=user_id, session_id=session_id)
+
+
+class StubGraphRun:
+    """Replacement for Orchestrator._run_graph that waits until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, input_data, start_ns, streaming=False):
+        self.calls.append(input_data.message)
+        await self.release.wait()
+        return AgentOutput(
+            response=f"answer to {input_data.message}",
+            agent_name="orchestrator",
+            metadata={"execution_time_ms": 1},
+        )
+
+
+@pytest.fixture
+def stub_run(monkeypatch):
+    run = StubGraphRun()
+    monkeypatch.setattr(orchestrator, "_run_graph", run)
+    return run
+
+
+@pytest.fixture
+def coalescing(monkeypatch):
+    monkeypatch.setattr(settings, "enable_orchestrator_request_coalescing", True)
+    yield
+    assert not orchestrator_module._inflight_runs
+
+
+async def test_identical_requests_share_one_run(stub_run, coalescing):
+    tasks = [
+        asyncio.create_task(orchestrator.process(_make_input(message)))
+        for message in ("Why is CPA high?", "why is  cpa high", "why is cpa high")
+    ]
+    await asyncio.sleep(0)
+    stub_run.release.set()
+    outputs = await asyncio.gather(*tasks)
+
+    assert stub_run.calls == ["Why is CPA high?"]
+    assert [output.metadata.get("coalesced") for output in outputs] == [None, True, True]
+    assert len({output.response for output in outputs}) == 1
+    # Joiners get their own copy, so their metadata flag doesn't leak into the leader's output
+    assert outputs[1] is not outputs[0]
+
+
+async def test_different_users_and_queries_are_not_coalesced(stub_run, coalescing):
+    tasks = [
+        asyncio.create_task(orchestrator.process(_make_input("why is cpa high", user_id="u1"))),
+        asyncio.create_task(orchestrator.process(_make_input("why is cpa high", user_id="u2"))),
+        asyncio.create_task(orchestrator.process(_make_input("why is ctr low", user_id="u1"))),
+    ]
+    await asyncio.sleep(0)
+    stub_run.release.set()
+    await asyncio.gather(*tasks)
+
+    assert len(stub_run.calls) == 3
+
+
+async def test_leader_cancellation_does_not_cancel_shared_run(stub_run, coalescing):
+    leader = asyncio.create_task(orchestrator.process(_make_input("why is cpa high")))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(orchestrator.process(_make_input("why is cpa high")))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    stub_run.release.set()
+
+    output = await joiner
+    assert output.response == "answer to why is cpa high"
+    assert output.metadata["coalesced"] is True
+    assert leader.cancelled()
+
+
+async def test_coalescing_disabled_runs_each_request(stub_run, monkeypatch):
+    monkeypatch.setattr(settings, "enable_orchestrator_request_coalescing", False)
+    stub_run.release.set()
+
+    await asyncio.gather(*(orchestrator.process(_make_input("why is cpa high")) for _ in range(2)))
+
+    assert len(stub_run.calls) == 2
+
+
+def _emitting_run(events):
+    """Stub _run_graph that emits the given (phase, status) events synchronously."""
+    async def run(input_data, start_ns, streaming=False):
+        for phase, status in events:
+            orchestrator._emit_progress(phase, status, message=f"{phase} {status}")
+        return AgentOutput(response="done", agent_name="orchestrator")
+
+    return run
+
+
+async def test_progress_delivered_in_order_before_return(monkeypatch):
+    events = [("routing", "started"), ("routing", "completed"), ("gate", "started"), ("gate", "completed")]
+    monkeypatch.setattr(orchestrator, "_run_graph", _emitting_run(events))
+    received = []
+
+    async def slow_callback(phase, status, details):
+        await asyncio.sleep(0.001)
+        received.append((phase, status, details))
+
+    output = await orchestrator.invoke_with_progress(_make_input("why is cpa high"), slow_callback)
+
+    # Every event is delivered before invoke_with_progress returns
+    assert output.response == "done"
+    assert [(phase, status) for phase, status, _ in received] == events
+    assert all(details["message"] and details["elapsed_ms"] >= 0 for _, _, details in received)
+
+
+async def test_progress_queue_drops_oldest_when_full(monkeypatch):
+    limit = orchestrator_module._MAX_PENDING_PROGRESS
+    events = [("invoke_agents", f"running-{i}") for i in range(limit + 5)]
+    monkeypatch.setattr(orchestrator, "_run_graph", _emitting_run(events))
+    received = []
+
+    async def callback(phase, status, details):
+        received.append(status)
+
+    await orchestrator.invoke_with_progress(_make_input("why is cpa high"), callback)
+
+    assert received == [status for _, status in events[-limit:]]
+
+
+async def test_progress_callback_failure_does_not_stop_delivery(monkeypatch):
+    events = [("routing", "started"), ("routing", "completed"), ("gate", "started")]
+    monkeypatch.setattr(orchestrator, "_run_graph", _emitting_run(events))
+    received = []
+
+    async def flaky_callback(phase, status, details):
+        received.append((phase, status))
+        if status == "started" and phase == "routing":
+            raise RuntimeError("client went away")
+
+    output = await orchestrator.invoke_with_progress(_make_input("why is cpa high"), flaky_callback)
+
+    assert output.response == "done"
+    assert received == events
+
+
+async def test_concurrent_progress_runs_stay_separate(monkeypatch):
+    async def run(input_data, start_ns, streaming=False):
+        for step in range(3):
+            orchestrator._emit_progress("invoke_agents", "running", message=f"{input_data.message} {step}")
+            await asyncio.sleep(0)
+        return AgentOutput(response=input_data.message, agent_name="orchestrator")
+
+    monkeypatch.setattr(orchestrator, "_run_graph", run)
+    received = {"a": [], "b": []}
+
+    def collector(name):
+        async def callback(phase, status, details):
+            received[name].append(details["message"])
+        return callback
+
+    await asyncio.gather(
+        orchestrator.invoke_with_progress(_make_input("a"), collector("a")),
+        orchestrator.invoke_with_progress(_make_input("b"), collector("b")),
+    )
+
+    assert received == {"a": ["a 0", "a 1", "a 2"], "b": ["b 0", "b 1", "b 2"]}
+
+
+def test_emit_progress_without_callback_is_a_noop():
+    def factory():
+        raise AssertionError("details_factory must not run without a callback")
+
+    orchestrator._emit_progress("routing", "started", details_factory=factory)
+
+
+async def test_fast_path_falls_back_when_session_store_fails(monkeypatch):
+    async def broken_get_messages(session_id, limit=None):
+        raise ConnectionError("session store down")
+
+    monkeypatch.setattr(orchestrator_module.session_manager, "get_messages", broken_get_messages)
+    input_data = _make_input("what is the performance of my campaign", session_id=uuid4())
+
+    assert orchestrator_module.routing_agent.match_keywords(input_data.message) == ["performance_diagnosis"]
+    assert await orchestrator._try_fast_path(input_data, time.monotonic_ns()) is None
+
+
+def test_response_cache_key_normalizes_query():
+    key = orchestrator_module._response_cache_key
+    history = [{"role": "user", "content": "hi"}]
+
+    assert key("Why is CPA high?", []) == key("  why is   cpa HIGH ", [])
+    assert key("why is cpa high", history) == key("Why is CPA high?", list(history))
+    assert key("why is cpa high", []) != key("why is cpa high", history)
+    assert key("why is cpa high", []) != key("why is ctr low", [])
+
+
+def test_history_fingerprint_covers_routing_window():
+    fingerprint = orchestrator_module._history_fingerprint
+    window = orchestrator_module._ROUTING_HISTORY_WINDOW
+    history = [{"role": "user", "content": f"message {i}"} for i in range(window + 2)]
+
+    assert fingerprint([]) == b""
+    assert len(fingerprint(history)) == 16
+    # Messages older than the routing window don't change the fingerprint
+    assert fingerprint(history) == fingerprint(history[-window:])
+    assert fingerprint(history) != fingerprint(history[:-1])
+    assert fingerprint([{"role": "user", "content": "x"}]) != fingerprint([{"role": "assistant", "content": "x"}])
@@ -0,0 +1,127 @@
+"""
+Tests for the orchestrator's optional reasoning steps, run through the real graph.
+
+Routing, the specialist agents, diagnosis and recommendations are stubbed, so
+no LLM or data source is called.
+"""
+import importlib
+
+import pytest
+
+from src.core.config import settings
+from src.schemas.agent import AgentInput, AgentOutput
+
+orchestrator_module = importlib.import_module("src.agents.orchestrator")
+orchestrator = orchestrator_module.orchestrator
+
+
+class StubAgent:
+    """Specialist agent double returning a fixed, confident answer."""
+
+    def __init__(self, name: str):
+        self.agent_name = name
+
+    async def invoke(self, input_data: AgentInput) -> AgentOutput:
+        return AgentOutput(
+            response=f"{self.agent_name} analysis: spend is on track and delivery is healthy",
+            agent_name=self.agent_name,
+            confidence=0.9,
+        )
+
+
+@pytest.fixture
+def stub_graph_dependencies(monkeypatch):
+    """Stub every external call the graph makes; returns the routing result to use."""
+    routing_result = {}
+
+    async def route(query, conversation_history=None):
+        return dict(routing_result)
+
+    async def no_history(session_id, query):
+        return []
+
+    async def diagnose(agent_results, query, conversation_history=None, gate_warnings=None):
+        return {
+            "summary": "Budget pacing is behind plan, which limits delivery on the top line items.",
+            "severity": "high",
+            "root_causes": ["under-pacing"],
+            "issues": ["pacing"],
+        }
+
+    async def generate_recommendations(diagnosis, agent_results, query):
+        return {
+            "recommendations": [
+                {"action": "Increase daily budget on the top line items", "priority": "high", "reason": "pacing"}
+            ],
+            "confidence": 0.7,
+        }
+
+    monkeypatch.setattr(orchestrator_module.routing_agent, "route", route)
+    monkeypatch.setattr(orchestrator, "_get_history", no_history)
+    monkeypatch.setattr(orchestrator_module.diagnosis_agent, "diagnose", diagnose)
+    monkeypatch.setattr(
+        orchestrator_module.recommendation_agent, "generate_recommendations", generate_recommendations
+    )
+    for name in list(orchestrator.specialist_agents):
+        monkeypatch.setitem(orchestrator.specialist_agents, name, StubAgent(name))
+
+    monkeypatch.setattr(settings, "enable_orchestrator_fast_path", False)
+    monkeypatch.setattr(settings, "enable_orchestrator_response_cache", False)
+    monkeypatch.setattr(settings, "enable_orchestrator_request_coalescing", False)
+    monkeypatch.setattr(settings, "enable_llm_response_cache", False)
+    return routing_result
+
+
+PATHS = {
+    "early_exit": (
+        "what is the performance of my campaign",
+        {"selected_agents": ["performance_diagnosis"], "confidence": 0.9, "raw_response": "{}"},
+    ),
+    "recommendation": (
+        "why is budget pacing and performance bad",
+        {"selected_agents": ["performance_diagnosis", "budget_risk"], "confidence": 0.9, "raw_response": "{}"},
+    ),
+    "clarification": (
+        "budget",
+        {"clarification_needed": True, "clarification_message": "Which campaign?", "selected_agents": []},
+    ),
+}
+
+
+async def _run(stub_graph_dependencies, path: str) -> AgentOutput:
+    query, routing_result = PATHS[path]
+    stub_graph_dependencies.clear()
+    stub_graph_dependencies.update(routing_result)
+    return await orchestrator.process(AgentInput(message=query, user_id="u1"))
+
+
+@pytest.mark.parametrize("path", list(PATHS))
+async def test_reasoning_is_empty_when_disabled(monkeypatch, stub_graph_dependencies, path):
+    monkeypatch.setattr(settings, "orchestrator_include_reasoning", False)
+
+    output = await _run(stub_graph_dependencies, path)
+
+    assert output.confidence > 0 or path == "clarification"
+    assert output.reasoning == ""
+
+
+@pytest.mark.parametrize("path", list(PATHS))
+async def test_reasoning_is_recorded_when_enabled(monkeypatch, stub_graph_dependencies, path):
+    monkeypatch.setattr(settings, "orchestrator_include_reasoning", True)
+
+    output = await _run(stub_graph_dependencies, path)
+
+    steps = output.reasoning.split("\n")
+    assert steps[-1] == "Generated final response"
+    assert steps[0].startswith("Routing:")
+
+
+async def test_paths_reach_expected_terminal_nodes(monkeypatch, stub_graph_dependencies):
+    monkeypatch.setattr(settings, "orchestrator_include_reasoning", True)
+
+    early_exit = await _run(stub_graph_dependencies, "early_exit")
+    recommendation = await _run(stub_graph_dependencies, "recommendation")
+
+    assert "Diagnosis skipped: Single-agent informational query" in early_exit.reasoning
+    assert "Generated 1 recommendations" not in early_exit.reasoning
+    assert "Generated 1 recommendations with confidence 0.70" in recommendation.reasoning
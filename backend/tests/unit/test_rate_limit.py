@@ -0,0 +1,98 @@
+"""
+Tests for the Redis rate-limit window and the gate's local block cache.
+"""
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import cache
+from src.core.config import settings
+
+gate_module = importlib.import_module("src.agents.gate_node")
+
+
+@pytest.fixture
+def gate(monkeypatch, fake_redis, clock):
+    """Gate node on the fake clock, with a limit of 3 requests per minute."""
+    monkeypatch.setattr(settings, "rate_limit_requests_per_minute", 3)
+    monkeypatch.setattr(gate_module, "time", SimpleNamespace(time=clock.time))
+    gate_module._BLOCKED_USERS.clear()
+    yield gate_module.GateNode()
+    gate_module._BLOCKED_USERS.clear()
+
+
+async def test_consume_rate_limit_counts_within_window(fake_redis, clock):
+    assert await cache.consume_rate_limit("u1") == (1, 60_000)
+
+    clock.advance(10)
+    assert await cache.consume_rate_limit("u1") == (2, 50_000)
+
+    # Users have separate windows
+    assert await cache.consume_rate_limit("u2") == (1, 60_000)
+
+
+async def test_consume_rate_limit_starts_new_window_after_expiry(fake_redis, clock):
+    await cache.consume_rate_limit("u1")
+    await cache.consume_rate_limit("u1")
+
+    clock.advance(60)
+    assert await cache.consume_rate_limit("u1") == (1, 60_000)
+
+
+async def test_consume_rate_limit_reregisters_script_for_new_client(fake_redis, monkeypatch, clock):
+    await cache.consume_rate_limit("u1")
+    first_script = cache._rate_limit_script
+
+    other_client = type(fake_redis)(clock)
+    monkeypatch.setattr(cache, "redis_client", other_client)
+    await cache.consume_rate_limit("u1")
+
+    assert cache._rate_limit_script is not first_script
+    assert cache._rate_limit_script.registered_client is other_client
+
+
+async def test_check_rate_limit_allows_then_denies(fake_redis):
+    assert await cache.check_rate_limit("u1", limit_per_minute=2)
+    assert await cache.check_rate_limit("u1", limit_per_minute=2)
+    assert not await cache.check_rate_limit("u1", limit_per_minute=2)
+
+
+async def test_gate_allows_up_to_limit(gate, clock):
+    results = [await gate.check_rate_limit("u1") for _ in range(3)]
+
+    assert all(result["allowed"] for result in results)
+    assert [result["remaining"] for result in results] == [2, 1, 0]
+    assert results[0]["reset_time"] == pytest.approx(clock.time() + 60)
+
+
+async def test_gate_denies_over_limit_and_blocks_locally(gate, fake_redis):
+    for _ in range(3):
+        await gate.check_rate_limit("u1")
+
+    denied = await gate.check_rate_limit("u1")
+    assert not denied["allowed"]
+    assert denied["remaining"] == 0
+
+    # Further requests in the window are rejected without a Redis call
+    calls = fake_redis.script_calls
+    blocked = await gate.check_rate_limit("u1")
+    assert not blocked["allowed"]
+    assert blocked["reset_time"] == denied["reset_time"]
+    assert fake_redis.script_calls == calls
+
+    # Other users are unaffected
+    assert (await gate.check_rate_limit("u2"))["allowed"]
+
+
+async def test_gate_allows_again_after_window_resets(gate, fake_redis, clock):
+    for _ in range(4):
+        await gate.check_rate_limit("u1")
+    assert not (await gate.check_rate_limit("u1"))["allowed"]
+
+    clock.advance(60)
+    result = await gate.check_rate_limit("u1")
+
+    assert result["allowed"]
+    assert result["remaining"] == 2
+    assert "u1" not in gate_module._BLOCKED_USERS
@@ -0,0 +1,104 @@
+"""
+Tests for the orchestrator response cache, backed by a fake Redis.
+"""
+import importlib
+
+import pytest
+
+from src.core import cache
+from src.core.config import settings
+from src.schemas.agent import AgentInput
+
+orchestrator_module = importlib.import_module("src.agents.orchestrator")
+orchestrator = orchestrator_module.orchestrator
+
+
+class StubGraph:
+    """Stands in for the compiled graph, returning a finished state."""
+
+    def __init__(self, confidence: float = 0.8, agent_errors=None):
+        self.calls = 0
+        self.confidence = confidence
+        self.agent_errors = agent_errors or {}
+
+    async def ainvoke(self, initial_state, config=None):
+        self.calls += 1
+        return {
+            **initial_state,
+            "final_response": f"answer to {initial_state['query']}",
+            "confidence": self.confidence,
+            "agent_errors": self.agent_errors,
+        }
+
+
+@pytest.fixture
+def response_cache(monkeypatch, fake_redis):
+    monkeypatch.setattr(settings, "enable_orchestrator_response_cache", True)
+    monkeypatch.setattr(settings, "enable_orchestrator_fast_path", False)
+
+    async def no_history(session_id, query):
+        return []
+
+    monkeypatch.setattr(orchestrator, "_get_history", no_history)
+    return fake_redis
+
+
+def _use_graph(monkeypatch, graph: StubGraph) -> StubGraph:
+    monkeypatch.setattr(orchestrator, "graph", graph)
+    return graph
+
+
+async def test_set_and_get_response_cache_round_trip(fake_redis, clock):
+    await cache.set_response_cache("k", {"response": "hello"}, ttl_seconds=30)
+
+    assert await cache.get_response_cache("k") == {"response": "hello"}
+    clock.advance(30)
+    assert await cache.get_response_cache("k") is None
+
+
+async def test_repeated_query_is_served_from_cache(monkeypatch, response_cache):
+    graph = _use_graph(monkeypatch, StubGraph())
+
+    first = await orchestrator.process(AgentInput(message="Why is CPA high?", user_id="u1"))
+    second = await orchestrator.process(AgentInput(message="why is cpa high", user_id="u1"))
+
+    assert graph.calls == 1
+    assert second.response == first.response
+    assert second.metadata["cache_hit"] is True
+    assert "cache_hit" not in first.metadata
+
+
+async def test_time_sensitive_query_bypasses_cache(monkeypatch, response_cache):
+    graph = _use_graph(monkeypatch, StubGraph())
+
+    for _ in range(2):
+        await orchestrator.process(AgentInput(message="what is spend today", user_id="u1"))
+
+    assert graph.calls == 2
+    assert not response_cache.store
+
+
+@pytest.mark.parametrize("stub", [StubGraph(confidence=0.0), StubGraph(agent_errors={"budget_risk": "timeout"})])
+async def test_partial_or_zero_confidence_answers_are_not_cached(monkeypatch, response_cache, stub):
+    graph = _use_graph(monkeypatch, stub)
+    graph.calls = 0
+
+    for _ in range(2):
+        await orchestrator.process(AgentInput(message="why is cpa high", user_id="u1"))
+
+    assert graph.calls == 2
+    assert not response_cache.store
+
+
+async def test_cache_failure_falls_back_to_graph(monkeypatch, response_cache):
+    graph = _use_graph(monkeypatch, StubGraph())
+
+    async def broken_get(key):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(orchestrator_module, "get_response_cache", broken_get)
+    output = await orchestrator.process(AgentInput(message="why is cpa high", user_id="u1"))
+
+    assert graph.calls == 1
+    assert output.response == "answer to why is cpa high"
+